@@ -4,14 +4,20 @@ This module analyzes parsed schema endpoints to generate metadata
 for code generation, including statistics, patterns, and validation.
 """
 
-from collections import Counter, defaultdict
+import sys
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
 from .parse_schema import Endpoint, Parameter
 
+# Parameter types and formats that are not reported as edge cases
+_KNOWN_TYPES = frozenset({"string", "integer", "boolean", "array", "object"})
+_KNOWN_FORMATS = frozenset({"pve-node", "pve-vmid", "pve-storage-id", "email", "uuid"})
 
-@dataclass
+
+@dataclass(slots=True)
 class SchemaStats:
     """Statistics about the parsed schema."""
 
@@ -22,27 +28,27 @@ class SchemaStats:
     leaf_endpoints: int = 0
     endpoints_with_path_params: int = 0
     unique_path_param_names: set[str] = None
-    method_counts: dict[str, int] = None
-    parameter_type_counts: dict[str, int] = None
-    format_counts: dict[str, int] = None
+    method_counts: Counter[str] = None
+    parameter_type_counts: Counter[str] = None
+    format_counts: Counter[str] = None
 
     def __post_init__(self):
         if self.unique_path_param_names is None:
             self.unique_path_param_names = set()
         if self.method_counts is None:
-            self.method_counts = {}
+            self.method_counts = Counter()
         if self.parameter_type_counts is None:
-            self.parameter_type_counts = {}
+            self.parameter_type_counts = Counter()
         if self.format_counts is None:
-            self.format_counts = {}
+            self.format_counts = Counter()
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaAnalysis:
     """Complete analysis of parsed schema."""
 
     stats: SchemaStats
-    endpoint_tree: dict[str, Any]
+    endpoint_tree: dict[str, Any]  # Empty unless requested with include_tree=True
     common_models: dict[str, list[Parameter]]
     edge_cases: list[str]
     parameter_patterns: dict[str, Any]
@@ -51,155 +57,236 @@ class SchemaAnalysis:
 class SchemaAnalyzer:
     """Analyze parsed schema endpoints for code generation metadata."""
 
-    def analyze(self, endpoints: list[Endpoint]) -> SchemaAnalysis:
+    def analyze(self, endpoints: list[Endpoint], include_tree: bool = False) -> SchemaAnalysis:
         """Analyze endpoints and generate comprehensive metadata.
 
-        Args:
-            endpoints: List of parsed Endpoint objects.
-
-        Returns:
-            SchemaAnalysis with statistics and patterns.
-        """
-        stats = self._collect_stats(endpoints)
-        endpoint_tree = self._build_endpoint_tree(endpoints)
-        common_models = self._identify_common_models(endpoints)
-        edge_cases = self._detect_edge_cases(endpoints)
-        parameter_patterns = self._analyze_parameter_patterns(endpoints)
-
-        return SchemaAnalysis(
-            stats=stats,
-            endpoint_tree=endpoint_tree,
-            common_models=common_models,
-            edge_cases=edge_cases,
-            parameter_patterns=parameter_patterns,
-        )
-
-    def _collect_stats(self, endpoints: list[Endpoint]) -> SchemaStats:
-        """Collect comprehensive statistics about the schema.
+        All statistics, the endpoint tree, common models, edge cases and
+        parameter patterns are collected in a single pass over the tree.
 
         Args:
             endpoints: List of parsed Endpoint objects.
+            include_tree: Whether to build the nested endpoint tree. It mirrors
+                the whole schema as dicts, so it is skipped unless requested and
+                endpoint_tree is left empty.
 
         Returns:
-            SchemaStats with all statistics.
+            SchemaAnalysis with statistics and patterns.
         """
         stats = SchemaStats()
+        root_endpoints: list[dict[str, Any]] = []
+        # Maps id(child endpoint) to the "children" list of its parent's tree node
+        child_lists: dict[int, list[dict[str, Any]]] = {}
+        # First parameter list seen per signature, and signatures seen again
+        first_params: dict[frozenset[tuple[str, str]], list[Parameter]] = {}
+        repeated_sigs: set[frozenset[tuple[str, str]]] = set()
+        edge_cases = []
+        patterns = {
+            "common_names": Counter(),
+            "common_types": Counter(),
+            "optional_ratios": {},
+            "constraint_usage": Counter(),
+        }
+        optional_count = 0
 
-        def traverse_endpoint(endpoint: Endpoint):
+        # Bind hot containers to locals once instead of per parameter
+        method_counts = stats.method_counts
+        parameter_type_counts = stats.parameter_type_counts
+        format_counts = stats.format_counts
+        unique_path_param_names = stats.unique_path_param_names
+        common_names = patterns["common_names"]
+        common_types = patterns["common_types"]
+        constraint_usage = patterns["constraint_usage"]
+        add_edge_case = edge_cases.append
+
+        for endpoint in self._walk(endpoints):
+            path = endpoint.path
+            children = endpoint.children
+            methods = endpoint.methods
+
+            # Statistics
             stats.total_endpoints += 1
 
-            if endpoint.children:
+            if children:
                 stats.endpoints_with_children += 1
             else:
                 stats.leaf_endpoints += 1
 
             if endpoint.path_params:
                 stats.endpoints_with_path_params += 1
-                stats.unique_path_param_names.update(endpoint.path_params)
+                unique_path_param_names.update(endpoint.path_params)
+
+            # Endpoint tree
+            if include_tree:
+                node = {
+                    "path": path,
+                    "text": endpoint.text,
+                    "leaf": endpoint.leaf,
+                    "path_params": endpoint.path_params,
+                    "python_path": endpoint.python_path,
+                    "class_name": endpoint.class_name,
+                    "methods": list(methods.keys()),
+                    "method_count": len(methods),
+                    "parameter_count": sum(len(m.parameters) for m in methods.values()),
+                }
+                child_lists.pop(id(endpoint), root_endpoints).append(node)
+
+                if children:
+                    child_nodes = node["children"] = []
+                    for child in children:
+                        child_lists[id(child)] = child_nodes
+
+            # Check for dynamic parameters like link[n]
+            if "[" in path and "]" in path:
+                add_edge_case(f"Dynamic parameter pattern in {path}")
+
+            for method_name, method in methods.items():
+                parameters = method.parameters
+                param_count = len(parameters)
 
-            # Count methods
-            for method_name in endpoint.methods:
                 stats.total_methods += 1
-                stats.method_counts[method_name] = stats.method_counts.get(method_name, 0) + 1
-
-                method = endpoint.methods[method_name]
-                stats.total_parameters += len(method.parameters)
-
-                # Count parameter types and formats
-                for param in method.parameters:
-                    stats.parameter_type_counts[param.type] = (
-                        stats.parameter_type_counts.get(param.type, 0) + 1
-                    )
-                    if param.format:
-                        if isinstance(param.format, str):
-                            stats.format_counts[param.format] = (
-                                stats.format_counts.get(param.format, 0) + 1
-                            )
-                        elif isinstance(param.format, dict):
+                method_counts[method_name] += 1
+                stats.total_parameters += param_count
+
+                # Only consider methods with multiple params as common model candidates
+                if param_count > 3:
+                    # Parameter names are unique per method, so a frozenset is a
+                    # canonical signature without sorting
+                    param_sig = frozenset([(p.name, p.type) for p in parameters])
+                    if param_sig in first_params:
+                        repeated_sigs.add(param_sig)
+                    else:
+                        first_params[param_sig] = parameters
+
+                # Check for unusual parameter counts
+                if param_count > 20:
+                    add_edge_case(f"High parameter count ({param_count}) in {path} {method_name}")
+
+                for param in parameters:
+                    param_type = param.type
+                    param_format = param.format
+
+                    # Count parameter types and formats
+                    parameter_type_counts[param_type] += 1
+                    if param_format:
+                        if isinstance(param_format, str):
+                            format_counts[param_format] += 1
+                        elif isinstance(param_format, dict):
                             # Complex format with sub-properties
-                            stats.format_counts["complex_format"] = (
-                                stats.format_counts.get("complex_format", 0) + 1
-                            )
+                            format_counts["complex_format"] += 1
 
-            # Recurse on children
-            for child in endpoint.children:
-                traverse_endpoint(child)
+                    # Check for unusual parameter types
+                    if param_type not in _KNOWN_TYPES:
+                        add_edge_case(
+                            f"Unusual parameter type '{param_type}' in {path} {method_name}"
+                        )
 
-        for endpoint in endpoints:
-            traverse_endpoint(endpoint)
+                    # Check for custom formats (complex dict formats are never known)
+                    if param_format and (
+                        not isinstance(param_format, str) or param_format not in _KNOWN_FORMATS
+                    ):
+                        add_edge_case(f"Unknown format '{param_format}' in {path} {method_name}")
 
-        return stats
+                    # Parameter patterns
+                    common_names[param.name] += 1
+                    common_types[param_type] += 1
+                    if param.optional:
+                        optional_count += 1
 
-    def _build_endpoint_tree(self, endpoints: list[Endpoint]) -> dict[str, Any]:
-        """Build hierarchical tree representation of endpoints.
+                    # Track constraints
+                    if param.minimum is not None or param.maximum is not None:
+                        constraint_usage["range"] += 1
+                    if param.pattern:
+                        constraint_usage["pattern"] += 1
+                    if param.enum:
+                        constraint_usage["enum"] += 1
+                    if param.max_length:
+                        constraint_usage["length"] += 1
+                    if param_format:
+                        constraint_usage["format"] += 1
 
-        Args:
-            endpoints: List of parsed Endpoint objects.
+        # Only keep parameter sets that appear in multiple places
+        # This is a simplified implementation
+        # In a full implementation, we'd use clustering or similarity analysis
+        # Use the first occurrence's parameters
+        common_models = {
+            f"CommonParams{i}": params
+            for i, (param_sig, params) in enumerate(first_params.items())
+            if param_sig in repeated_sigs
+        }
 
-        Returns:
-            Dictionary representing the endpoint hierarchy.
-        """
+        # Calculate optional ratios
+        total_params = sum(common_names.values())
+        patterns["optional_ratios"] = {
+            "optional": optional_count,
+            "required": total_params - optional_count,
+            "ratio": optional_count / total_params if total_params > 0 else 0,
+        }
 
-        def endpoint_to_dict(endpoint: Endpoint) -> dict[str, Any]:
-            result = {
-                "path": endpoint.path,
-                "text": endpoint.text,
-                "leaf": endpoint.leaf,
-                "path_params": endpoint.path_params,
-                "python_path": endpoint.python_path,
-                "class_name": endpoint.class_name,
-                "methods": list(endpoint.methods.keys()),
-                "method_count": len(endpoint.methods),
-                "parameter_count": sum(len(m.parameters) for m in endpoint.methods.values()),
+        endpoint_tree = {}
+        if include_tree:
+            endpoint_tree = {
+                "root_endpoints": root_endpoints,
+                "total_endpoints": len(endpoints),
             }
 
-            if endpoint.children:
-                result["children"] = [endpoint_to_dict(child) for child in endpoint.children]
+        return SchemaAnalysis(
+            stats=stats,
+            endpoint_tree=endpoint_tree,
+            common_models=common_models,
+            edge_cases=edge_cases,
+            parameter_patterns=patterns,
+        )
+
+    def _walk(self, endpoints: list[Endpoint]) -> Iterator[Endpoint]:
+        """Yield every endpoint in the tree in depth-first pre-order.
 
-            return result
+        Uses an explicit stack instead of recursion so deep schemas cannot
+        exceed the interpreter recursion limit.
 
-        return {
-            "root_endpoints": [endpoint_to_dict(ep) for ep in endpoints],
-            "total_endpoints": len(endpoints),
-        }
+        Args:
+            endpoints: List of root Endpoint objects.
 
-    def _identify_common_models(self, endpoints: list[Endpoint]) -> dict[str, list[Parameter]]:
-        """Identify common parameter sets that could be reused as models.
+        Yields:
+            Each Endpoint, parents before their children.
+        """
+        stack = list(reversed(endpoints))
+        while stack:
+            endpoint = stack.pop()
+            yield endpoint
+            stack.extend(reversed(endpoint.children))
+
+    def _collect_stats(self, endpoints: list[Endpoint]) -> SchemaStats:
+        """Collect comprehensive statistics about the schema.
 
         Args:
             endpoints: List of parsed Endpoint objects.
 
         Returns:
-            Dictionary mapping model names to parameter lists.
+            SchemaStats with all statistics.
         """
-        # This is a simplified implementation
-        # In a full implementation, we'd use clustering or similarity analysis
-        common_models = {}
+        return self.analyze(endpoints).stats
 
-        # For now, just collect all unique parameter sets
-        param_sets = defaultdict(list)
+    def _build_endpoint_tree(self, endpoints: list[Endpoint]) -> dict[str, Any]:
+        """Build hierarchical tree representation of endpoints.
 
-        def collect_param_sets(endpoint: Endpoint):
-            for method in endpoint.methods.values():
-                if len(method.parameters) > 3:  # Only consider methods with multiple params
-                    # Create a signature for this parameter set
-                    param_sig = tuple(sorted((p.name, p.type) for p in method.parameters))
-                    param_sets[param_sig].append((endpoint.path, method.method, method.parameters))
+        Args:
+            endpoints: List of parsed Endpoint objects.
 
-            for child in endpoint.children:
-                collect_param_sets(child)
+        Returns:
+            Dictionary representing the endpoint hierarchy.
+        """
+        return self.analyze(endpoints, include_tree=True).endpoint_tree
 
-        for endpoint in endpoints:
-            collect_param_sets(endpoint)
+    def _identify_common_models(self, endpoints: list[Endpoint]) -> dict[str, list[Parameter]]:
+        """Identify common parameter sets that could be reused as models.
 
-        # Only keep parameter sets that appear in multiple places
-        for i, (param_sig, occurrences) in enumerate(param_sets.items()):
-            if len(occurrences) > 1:
-                model_name = f"CommonParams{i}"
-                # Use the first occurrence's parameters
-                common_models[model_name] = occurrences[0][2]
+        Args:
+            endpoints: List of parsed Endpoint objects.
 
-        return common_models
+        Returns:
+            Dictionary mapping model names to parameter lists.
+        """
+        return self.analyze(endpoints).common_models
 
     def _detect_edge_cases(self, endpoints: list[Endpoint]) -> list[str]:
         """Detect edge cases and unusual patterns in the schema.
@@ -210,46 +297,7 @@ class SchemaAnalyzer:
         Returns:
             List of strings describing edge cases found.
         """
-        edge_cases = []
-
-        def check_endpoint(endpoint: Endpoint):
-            # Check for dynamic parameters like link[n]
-            if "[" in endpoint.path and "]" in endpoint.path:
-                edge_cases.append(f"Dynamic parameter pattern in {endpoint.path}")
-
-            # Check for unusual parameter counts
-            for method_name, method in endpoint.methods.items():
-                if len(method.parameters) > 20:
-                    edge_cases.append(
-                        f"High parameter count ({len(method.parameters)}) in {endpoint.path} {method_name}"
-                    )
-
-                # Check for unusual parameter types
-                for param in method.parameters:
-                    if param.type not in ["string", "integer", "boolean", "array", "object"]:
-                        edge_cases.append(
-                            f"Unusual parameter type '{param.type}' in {endpoint.path} {method_name}"
-                        )
-
-                    # Check for custom formats
-                    if param.format and param.format not in [
-                        "pve-node",
-                        "pve-vmid",
-                        "pve-storage-id",
-                        "email",
-                        "uuid",
-                    ]:
-                        edge_cases.append(
-                            f"Unknown format '{param.format}' in {endpoint.path} {method_name}"
-                        )
-
-            for child in endpoint.children:
-                check_endpoint(child)
-
-        for endpoint in endpoints:
-            check_endpoint(endpoint)
-
-        return edge_cases
+        return self.analyze(endpoints).edge_cases
 
     def _analyze_parameter_patterns(self, endpoints: list[Endpoint]) -> dict[str, Any]:
         """Analyze parameter usage patterns across the schema.
@@ -260,64 +308,7 @@ class SchemaAnalyzer:
         Returns:
             Dictionary with parameter pattern analysis.
         """
-        patterns = {
-            "common_names": Counter(),
-            "common_types": Counter(),
-            "optional_ratios": {},
-            "constraint_usage": Counter(),
-        }
-
-        def collect_patterns(endpoint: Endpoint):
-            for method in endpoint.methods.values():
-                for param in method.parameters:
-                    patterns["common_names"][param.name] += 1
-                    patterns["common_types"][param.type] += 1
-
-                    # Track constraints
-                    constraints = []
-                    if param.minimum is not None or param.maximum is not None:
-                        constraints.append("range")
-                    if param.pattern:
-                        constraints.append("pattern")
-                    if param.enum:
-                        constraints.append("enum")
-                    if param.max_length:
-                        constraints.append("length")
-                    if param.format:
-                        constraints.append("format")
-
-                    for constraint in constraints:
-                        patterns["constraint_usage"][constraint] += 1
-
-            for child in endpoint.children:
-                collect_patterns(child)
-
-        for endpoint in endpoints:
-            collect_patterns(endpoint)
-
-        # Calculate optional ratios
-        total_params = sum(patterns["common_names"].values())
-        optional_count = 0
-
-        def count_optional(endpoint: Endpoint):
-            nonlocal optional_count
-            for method in endpoint.methods.values():
-                for param in method.parameters:
-                    if param.optional:
-                        optional_count += 1
-            for child in endpoint.children:
-                count_optional(child)
-
-        for endpoint in endpoints:
-            count_optional(endpoint)
-
-        patterns["optional_ratios"] = {
-            "optional": optional_count,
-            "required": total_params - optional_count,
-            "ratio": optional_count / total_params if total_params > 0 else 0,
-        }
-
-        return patterns
+        return self.analyze(endpoints).parameter_patterns
 
     def print_report(self, analysis: SchemaAnalysis) -> None:
         """Print a human-readable analysis report.
@@ -325,49 +316,61 @@ class SchemaAnalyzer:
         Args:
             analysis: SchemaAnalysis to print.
         """
-        print("=== Proxmox API Schema Analysis Report ===\n")
-
-        print("STATISTICS:")
-        print(f"  Total Endpoints: {analysis.stats.total_endpoints}")
-        print(f"  Total Methods: {analysis.stats.total_methods}")
-        print(f"  Total Parameters: {analysis.stats.total_parameters}")
-        print(f"  Endpoints with Children: {analysis.stats.endpoints_with_children}")
-        print(f"  Leaf Endpoints: {analysis.stats.leaf_endpoints}")
-        print(f"  Endpoints with Path Params: {analysis.stats.endpoints_with_path_params}")
-        print(f"  Unique Path Param Names: {sorted(analysis.stats.unique_path_param_names)}")
-        print()
-
-        print("METHOD COUNTS:")
-        for method, count in sorted(analysis.stats.method_counts.items()):
-            print(f"  {method}: {count}")
-        print()
-
-        print("PARAMETER TYPES:")
-        for ptype, count in sorted(analysis.stats.parameter_type_counts.items()):
-            print(f"  {ptype}: {count}")
-        print()
-
-        if analysis.stats.format_counts:
-            print("CUSTOM FORMATS:")
-            for fmt, count in sorted(analysis.stats.format_counts.items()):
-                print(f"  {fmt}: {count}")
-            print()
-
-        print("PARAMETER PATTERNS:")
-        print(f"  Optional Ratio: {analysis.parameter_patterns['optional_ratios']['ratio']:.2%}")
-        print(f"  Most Common Names: {analysis.parameter_patterns['common_names'].most_common(5)}")
-        print(f"  Most Common Types: {analysis.parameter_patterns['common_types'].most_common(5)}")
-        print(f"  Constraint Usage: {dict(analysis.parameter_patterns['constraint_usage'])}")
-        print()
+        stats = analysis.stats
+        patterns = analysis.parameter_patterns
+
+        # Build the whole report and write it to stdout in one call
+        lines = [
+            "=== Proxmox API Schema Analysis Report ===\n",
+            "STATISTICS:",
+            f"  Total Endpoints: {stats.total_endpoints}",
+            f"  Total Methods: {stats.total_methods}",
+            f"  Total Parameters: {stats.total_parameters}",
+            f"  Endpoints with Children: {stats.endpoints_with_children}",
+            f"  Leaf Endpoints: {stats.leaf_endpoints}",
+            f"  Endpoints with Path Params: {stats.endpoints_with_path_params}",
+            f"  Unique Path Param Names: {sorted(stats.unique_path_param_names)}",
+            "",
+            "METHOD COUNTS:",
+        ]
+        lines.extend(
+            f"  {method}: {count}" for method, count in sorted(stats.method_counts.items())
+        )
+        lines.append("")
+
+        lines.append("PARAMETER TYPES:")
+        lines.extend(
+            f"  {ptype}: {count}" for ptype, count in sorted(stats.parameter_type_counts.items())
+        )
+        lines.append("")
+
+        if stats.format_counts:
+            lines.append("CUSTOM FORMATS:")
+            lines.extend(f"  {fmt}: {count}" for fmt, count in sorted(stats.format_counts.items()))
+            lines.append("")
+
+        lines.extend(
+            [
+                "PARAMETER PATTERNS:",
+                f"  Optional Ratio: {patterns['optional_ratios']['ratio']:.2%}",
+                f"  Most Common Names: {patterns['common_names'].most_common(5)}",
+                f"  Most Common Types: {patterns['common_types'].most_common(5)}",
+                f"  Constraint Usage: {dict(patterns['constraint_usage'])}",
+                "",
+            ]
+        )
 
         if analysis.edge_cases:
-            print("EDGE CASES DETECTED:")
-            for case in analysis.edge_cases:
-                print(f"  - {case}")
-            print()
+            lines.append("EDGE CASES DETECTED:")
+            lines.extend(f"  - {case}" for case in analysis.edge_cases)
+            lines.append("")
 
         if analysis.common_models:
-            print("POTENTIAL COMMON MODELS:")
-            for name, params in analysis.common_models.items():
-                print(f"  {name}: {len(params)} parameters")
-            print()
+            lines.append("POTENTIAL COMMON MODELS:")
+            lines.extend(
+                f"  {name}: {len(params)} parameters"
+                for name, params in analysis.common_models.items()
+            )
+            lines.append("")
+
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -12,6 +12,9 @@ from typing import Any
 
 import httpx
 
+# Validated schemas loaded from cache files, keyed by (absolute path, mtime in ns)
+_SCHEMA_CACHE: dict[tuple[str, int], list[dict[str, Any]]] = {}
+
 
 class SchemaFetcher:
     """Fetch and parse Proxmox API schema from local or remote sources."""
@@ -20,9 +23,19 @@ class SchemaFetcher:
     COMMIT = "f42edd7afd805a27fd7a0b027d67ca7adeedc2c6"
     URL = f"https://raw.githubusercontent.com/proxmox/pve-docs/{COMMIT}/api-viewer/apidata.js"
 
-    def __init__(self):
-        """Initialize the schema fetcher for remote-only fetching."""
-        pass
+    # Start of the schema array: const apiSchema = [ ... ];
+    _SCHEMA_START = re.compile(r"const\s+apiSchema\s*=\s*\[")
+
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        """Initialize the schema fetcher for remote-only fetching.
+
+        Args:
+            client: HTTP client to reuse for remote fetches. If None, one is
+                created on first use and kept until aclose() is called.
+        """
+        self._decoder = json.JSONDecoder()
+        self._client = client
+        self._owns_client = client is None
 
     async def fetch_remote(self) -> str:
         """Fetch apidata.js from GitHub.
@@ -33,10 +46,18 @@ class SchemaFetcher:
         Raises:
             httpx.HTTPError: If the request fails.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.URL)
-            response.raise_for_status()
-            return response.text
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+
+        response = await self._client.get(self.URL)
+        response.raise_for_status()
+        return response.text
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if it was created by this fetcher."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def extract_schema_json(self, js_content: str) -> str:
         """Extract JSON from JavaScript apiSchema definition.
@@ -47,6 +68,21 @@ class SchemaFetcher:
         Returns:
             JSON string containing the schema array.
 
+        Raises:
+            ValueError: If apiSchema definition cannot be found or parsed.
+        """
+        _, start_pos, end_pos = self._decode_schema(js_content)
+        return js_content[start_pos:end_pos]
+
+    def _decode_schema(self, js_content: str) -> tuple[list[dict[str, Any]], int, int]:
+        """Decode the apiSchema array straight out of the JavaScript source.
+
+        Args:
+            js_content: Raw JavaScript content.
+
+        Returns:
+            Tuple of (parsed schema, start offset, end offset) of the JSON array.
+
         Raises:
             ValueError: If apiSchema definition cannot be found or parsed.
         """
@@ -56,43 +92,19 @@ class SchemaFetcher:
 
         # Find apiSchema definition - use a more robust approach
         # Look for the pattern: const apiSchema = [ ... ];
-        start_match = re.search(r"const\s+apiSchema\s*=\s*\[", js_content)
+        start_match = self._SCHEMA_START.search(js_content)
         if not start_match:
             raise ValueError("Could not find apiSchema definition start")
 
         start_pos = start_match.end() - 1  # Position of the opening [
 
-        # Find the matching closing ] by counting brackets
-        bracket_count = 1  # We start after the opening [
-        in_string = False
-        escape_next = False
-        pos = start_pos + 1
-
-        while pos < len(js_content):
-            char = js_content[pos]
-
-            if escape_next:
-                escape_next = False
-            elif char == "\\":
-                escape_next = True
-            elif not in_string and char == '"':
-                in_string = True
-            elif in_string and char == '"':
-                in_string = False
-            elif not in_string:
-                if char == "[":
-                    bracket_count += 1
-                elif char == "]":
-                    bracket_count -= 1
-                    if bracket_count == 0:
-                        # Found the matching closing bracket
-                        end_pos = pos
-                        json_str = js_content[start_pos : end_pos + 1]
-                        return json_str
-
-            pos += 1
-
-        raise ValueError("Could not find matching closing bracket for apiSchema")
+        # Let the C JSON scanner find the matching closing bracket
+        try:
+            schema, end_pos = self._decoder.raw_decode(js_content, start_pos)
+        except json.JSONDecodeError as e:
+            raise ValueError("Could not find matching closing bracket for apiSchema") from e
+
+        return schema, start_pos, end_pos
 
     def parse_json(self, json_str: str) -> list[dict[str, Any]]:
         """Parse JSON string to Python objects.
@@ -152,11 +164,17 @@ class SchemaFetcher:
 
         # Try to load from cache first
         if use_cache and os.path.exists(cache_file):
+            # Reuse a schema already loaded in this process if the file is unchanged
+            cache_key = (os.path.abspath(cache_file), os.stat(cache_file).st_mtime_ns)
+            if cache_key in _SCHEMA_CACHE:
+                return _SCHEMA_CACHE[cache_key]
+
             try:
                 with open(cache_file, encoding="utf-8") as f:
                     cached_schema = json.load(f)
                 # Validate cached schema
                 self.validate_schema(cached_schema)
+                _SCHEMA_CACHE[cache_key] = cached_schema
                 return cached_schema
             except (json.JSONDecodeError, ValueError):
                 # Cache is corrupted, fetch fresh
@@ -165,17 +183,16 @@ class SchemaFetcher:
         # Fetch from remote (primary source)
         js_content = await self.fetch_remote()
 
-        # Extract and parse JSON
-        json_str = self.extract_schema_json(js_content)
-        schema = self.parse_json(json_str)
+        # Extract and parse JSON in a single decode
+        schema, _, _ = self._decode_schema(js_content)
 
         # Validate structure
         self.validate_schema(schema)
 
-        # Cache the result
+        # Cache the result (compact output keeps json on its C encoder)
         os.makedirs(os.path.dirname(cache_file), exist_ok=True)
         with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(schema, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(schema, ensure_ascii=False, separators=(",", ":")))
 
         return schema
 
@@ -204,9 +221,8 @@ class SchemaFetcher:
         with open(local_file, encoding="utf-8") as f:
             js_content = f.read()
 
-        # Extract and parse JSON
-        json_str = self.extract_schema_json(js_content)
-        schema = self.parse_json(json_str)
+        # Extract and parse JSON in a single decode
+        schema, _, _ = self._decode_schema(js_content)
 
         # Validate structure
         self.validate_schema(schema)
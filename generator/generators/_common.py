@@ -0,0 +1,41 @@
+"""
+Helpers shared by the model and endpoint generators.
+
+This module holds the model naming scheme both generators must agree on,
+and the routine that writes generated source files to disk.
+"""
+
+import functools
+import os
+from pathlib import Path
+
+
+@functools.cache
+def model_path_prefix(api_path: str) -> str:
+    """Turn an API path into the prefix of its model names (cached per path)."""
+    path = api_path.replace("/", "_").replace("{", "").replace("}", "").replace("-", "_").title()
+    if path.startswith("_"):
+        path = path[1:]
+    return path
+
+
+@functools.cache
+def base_model_name(api_path: str, method_name: str, suffix: str) -> str:
+    """Build a model name (before de-duplication) for an endpoint method (cached)."""
+    return f"{model_path_prefix(api_path)}{method_name.upper()}{suffix}"
+
+
+def write_file(path: Path, content: str) -> None:
+    """
+    Write generated source to disk: encode once, then raw os.write calls.
+
+    New files get the same permissions as with Path.write_text (0o666 less
+    the process umask).
+    """
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
@@ -7,95 +7,10 @@ access to all API endpoints through hierarchical navigation.
 
 from dataclasses import dataclass
 
-import jinja2
-
 from ..parse_schema import Endpoint
 
-
-@dataclass
-class ClientFile:
-    """Represents the generated client file."""
-
-    filename: str
-    content: str
-
-
-class ClientGenerator:
-    """
-    Generates the main ProxmoxClient class.
-
-    Creates a client class that inherits from HTTPClient and provides
-    properties for accessing all root API endpoints.
-    """
-
-    def __init__(self):
-        pass
-
-    def generate(self, endpoints: list[Endpoint]) -> str:
-        """
-        Generate the main ProxmoxClient class code.
-
-        Args:
-            endpoints: List of parsed root endpoints
-
-        Returns:
-            Generated client code as string
-        """
-        # Collect root endpoint names
-        root_endpoints = self._collect_root_endpoints(endpoints)
-
-        # Generate client code using template
-        return self._generate_client_code(root_endpoints)
-
-    def generate_client(self, endpoints: list[Endpoint]) -> ClientFile:
-        """
-        Generate the main ProxmoxClient class.
-
-        Args:
-            endpoints: List of parsed root endpoints
-
-        Returns:
-            ClientFile containing the generated client code
-        """
-        # Collect root endpoint names
-        root_endpoints = self._collect_root_endpoints(endpoints)
-
-        # Generate client code using template
-        template_content = self._generate_client_code(root_endpoints)
-
-        return ClientFile(filename="client.py", content=template_content)
-
-    def _collect_root_endpoints(self, endpoints: list[Endpoint]) -> list[dict[str, str]]:
-        """Collect information about root endpoints."""
-        root_endpoints = []
-
-        for endpoint in endpoints:
-            # Get the root path component
-            path_parts = endpoint.path.strip("/").split("/")
-            if path_parts and path_parts[0]:
-                root_name = path_parts[0]
-                module_name = root_name.replace("-", "_")
-                class_name = self._generate_root_class_name(root_name)
-
-                root_endpoints.append(
-                    {
-                        "name": root_name.replace("-", "_"),
-                        "class_name": class_name,
-                        "module": module_name,
-                    }
-                )
-
-        return root_endpoints
-
-    def _generate_root_class_name(self, root_name: str) -> str:
-        """Generate class name for root endpoint."""
-        # Convert hyphens to underscores, capitalize and add suffix
-        return root_name.replace("-", "_").capitalize() + "Endpoints"
-
-    def _generate_client_code(self, root_endpoints: list[dict[str, str]]) -> str:
-        """Generate the complete client code."""
-        # Template for the client
-        template = '''"""
+# Template for the client module; filled with str.format()
+_CLIENT_TEMPLATE = '''"""
 Generated Proxmox VE API Client.
 
 This module contains the main ProxmoxClient class for accessing
@@ -106,10 +21,7 @@ DO NOT EDIT MANUALLY
 from typing import Optional
 from prmxctrl.base.http_client import HTTPClient
 
-{% for endpoint in root_endpoints %}
-from prmxctrl.endpoints.{{ endpoint.module }} import {{ endpoint.class_name }}
-{% endfor %}
-
+{imports}
 
 class ProxmoxClient(HTTPClient):
     """
@@ -167,18 +79,102 @@ class ProxmoxClient(HTTPClient):
             timeout=timeout,
         )
 
-{% for endpoint in root_endpoints %}
-    @property
-    def {{ endpoint.name }}(self) -> {{ endpoint.class_name }}:
-        """Access {{ endpoint.name }} API endpoints."""
-        return {{ endpoint.class_name }}(self, "/{{ endpoint.name }}")
+{properties}'''
+
+
+@dataclass(slots=True)
+class ClientFile:
+    """Represents the generated client file."""
+
+    filename: str
+    content: str
+
+
+class ClientGenerator:
+    """
+    Generates the main ProxmoxClient class.
+
+    Creates a client class that inherits from HTTPClient and provides
+    properties for accessing all root API endpoints.
+    """
+
+    def __init__(self):
+        pass
+
+    def generate(self, endpoints: list[Endpoint]) -> str:
+        """
+        Generate the main ProxmoxClient class code.
 
-{% endfor %}
-'''
+        Args:
+            endpoints: List of parsed root endpoints
 
-        # Set up Jinja2 environment
-        env = jinja2.Environment(trim_blocks=True, lstrip_blocks=True)
-        template_obj = env.from_string(template)
+        Returns:
+            Generated client code as string
+        """
+        # Collect root endpoint names
+        root_endpoints = self._collect_root_endpoints(endpoints)
 
-        # Render template
-        return template_obj.render(root_endpoints=root_endpoints)
+        # Generate client code using template
+        return self._generate_client_code(root_endpoints)
+
+    def generate_client(self, endpoints: list[Endpoint]) -> ClientFile:
+        """
+        Generate the main ProxmoxClient class.
+
+        Args:
+            endpoints: List of parsed root endpoints
+
+        Returns:
+            ClientFile containing the generated client code
+        """
+        # Collect root endpoint names
+        root_endpoints = self._collect_root_endpoints(endpoints)
+
+        # Generate client code using template
+        template_content = self._generate_client_code(root_endpoints)
+
+        return ClientFile(filename="client.py", content=template_content)
+
+    def _collect_root_endpoints(self, endpoints: list[Endpoint]) -> list[dict[str, str]]:
+        """Collect information about root endpoints, once per root name."""
+        root_endpoints = []
+        seen_roots: set[str] = set()
+
+        for endpoint in endpoints:
+            # Get the root path component
+            root_name = endpoint.path.strip("/").partition("/")[0]
+            if not root_name or root_name in seen_roots:
+                continue
+            seen_roots.add(root_name)
+
+            # Convert hyphens to underscores, capitalize and add suffix for the class
+            module_name = root_name.replace("-", "_")
+            root_endpoints.append(
+                {
+                    "name": module_name,
+                    "class_name": module_name.capitalize() + "Endpoints",
+                    "module": module_name,
+                }
+            )
+
+        return root_endpoints
+
+    def _generate_client_code(self, root_endpoints: list[dict[str, str]]) -> str:
+        """Generate the complete client code."""
+        imports = []
+        properties = []
+
+        for endpoint in root_endpoints:
+            name = endpoint["name"]
+            class_name = endpoint["class_name"]
+
+            imports.append(f"from prmxctrl.endpoints.{endpoint['module']} import {class_name}\n")
+            properties.append(
+                "    @property\n"
+                f"    def {name}(self) -> {class_name}:\n"
+                f'        """Access {name} API endpoints."""\n'
+                f'        return {class_name}(self, "/{name}")\n'
+                "\n"
+            )
+
+        return _CLIENT_TEMPLATE.format(imports="".join(imports), properties="".join(properties))
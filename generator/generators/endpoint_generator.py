@@ -5,8 +5,13 @@ This module generates hierarchical endpoint classes from parsed schema endpoints
 creating type-safe method calls that mirror the Proxmox API structure.
 """
 
+import functools
+import keyword
 import re
-from collections import defaultdict
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -14,9 +19,177 @@ from typing import Any
 import jinja2
 
 from ..parse_schema import Endpoint, Method
+from ._common import base_model_name, write_file
+
+# Jinja2 environment and endpoint template, compiled once per process.
+# Compiled template bytecode is also cached on disk across generator runs.
+_TEMPLATE_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).parent.parent / "templates"),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
+)
+_ENDPOINT_TEMPLATE = _TEMPLATE_ENV.get_template("endpoint.py.jinja")
+
+# Return statements per HTTP method: (with a parameter model, without one)
+_RETURN_STATEMENTS: dict[str, tuple[str, str]] = {
+    "GET": (
+        "return await self._get(params=params.model_dump(exclude_none=True, by_alias=True) if params else None)",
+        "return await self._get()",
+    ),
+    "POST": (
+        "return await self._post(data=params.model_dump(exclude_none=True, by_alias=True) if params else None)",
+        "return await self._post()",
+    ),
+    "PUT": (
+        "return await self._put(data=params.model_dump(exclude_none=True, by_alias=True) if params else None)",
+        "return await self._put()",
+    ),
+    "DELETE": ("return await self._delete()", "return await self._delete()"),
+}
+
+# Docstring header of every generated endpoint package __init__.py
+_INIT_HEADER = '''"""
+Auto-generated endpoint module.
+
+This module contains hierarchical endpoint classes for Proxmox VE API access.
+DO NOT EDIT MANUALLY
+"""
+
+'''
+
+# A path segment that is not a {param}, capturing the segment
+_NON_PARAM_SEG_RE = re.compile(r"(?:^|/)([^/{][^/]*)")
+
+# A class definition line; [^\S\n] keeps each match within one line
+_CLASS_DEF_RE = re.compile(r"^[^\S\n]*class[^\S\n]+(\w+)[^\S\n]*\(", re.MULTILINE)
+
+# Imports every endpoint file starts with
+_BASE_IMPORTS = "\n".join(
+    (
+        "from prmxctrl.base.endpoint_base import EndpointBase",
+        "from typing import Optional",
+    )
+)
+
+# Python keywords that must be suffixed with "_" when used as identifiers
+_PY_KEYWORDS: frozenset[str] = frozenset(keyword.kwlist)
+
+
+def _walk_endpoints(endpoints: list[Endpoint]) -> Iterator[Endpoint]:
+    """
+    Yield every endpoint in the tree in pre-order (schema order).
+
+    Uses an explicit stack rather than recursion, so deeply nested paths
+    cannot hit the interpreter recursion limit.
+    """
+    stack = list(reversed(endpoints))
+    while stack:
+        endpoint = stack.pop()
+        yield endpoint
+        stack.extend(reversed(endpoint.children))
+
+
+def _render_file(classes: list["EndpointClass"], imports: str) -> str:
+    """Render one endpoint module (module-level so pool workers can run it)."""
+    return _ENDPOINT_TEMPLATE.render(classes=classes, imports=imports)
+
+
+@functools.cache
+def _sanitize(name: str) -> str:
+    """Turn a path segment or method name into an identifier (hyphens, keywords)."""
+    name = name.replace("-", "_")
+    if name in _PY_KEYWORDS:
+        name += "_"
+    return name
+
+
+@functools.cache
+def _split_path(api_path: str) -> tuple[str, ...]:
+    """Split an API path into its non-empty segments (cached per path)."""
+    return tuple(p for p in api_path.split("/") if p)
+
+
+@functools.cache
+def _name_segments(api_path: str) -> tuple[str, ...]:
+    """Return the non-parameter segments of an API path (cached per path)."""
+    return tuple(_NON_PARAM_SEG_RE.findall(api_path))
 
 
-@dataclass
+@functools.cache
+def _file_path_for(api_path: str, has_path_params: bool) -> str:
+    """
+    Determine the module file path for an API path.
+
+    Pure function of its arguments, so results are cached for the whole run.
+    See EndpointGenerator._get_file_path for the layout.
+    """
+    path_parts = _split_path(api_path)
+
+    if not path_parts:
+        return "common.py"
+
+    # Convert path parts to valid Python identifiers
+    # Replace {param} with param_item for valid directory names
+    converted_parts = []
+    for p in path_parts:
+        if p[:1] == "{" and p[-1:] == "}":
+            # {node} -> node_item
+            param_name = p.strip("{}")
+            # Avoid Python keywords
+            if param_name in _PY_KEYWORDS:
+                param_name += "_"
+            converted_parts.append(f"{param_name}_item")
+        else:
+            # Regular parts: replace hyphens with underscores and avoid keywords
+            converted_parts.append(_sanitize(p))
+
+    # Check if this endpoint has path parameters
+    if has_path_params:
+        # Item accessor: use _item.py in the appropriate directory
+        result_parts = converted_parts + ["_item"]
+        filename = "/".join(result_parts) + ".py"
+    else:
+        # Regular endpoint: use path as module
+        filename = "/".join(converted_parts) + ".py"
+
+    return filename
+
+
+@functools.cache
+def _relative_import(from_path: str, to_path: str) -> str:
+    """
+    Calculate the relative import path from one module file to another.
+
+    Pure function of its arguments, so results are cached for the whole run.
+    See EndpointGenerator._calculate_relative_import for examples.
+    """
+    from_parts = from_path.replace(".py", "").split("/")
+    to_parts = to_path.replace(".py", "").split("/")
+
+    # Directory path for the from file (excluding the filename)
+    from_dir_parts = from_parts[:-1] if from_parts else []
+    to_file_parts = to_parts
+
+    # Find common prefix between directory paths
+    common_len = 0
+    for i, (from_dir, to_file) in enumerate(zip(from_dir_parts, to_file_parts)):
+        if from_dir == to_file:
+            common_len = i + 1
+        else:
+            break
+
+    # Calculate relative path
+    up_levels = len(from_dir_parts) - common_len
+    down_parts = to_file_parts[common_len:]
+
+    # Always include at least one "." for relative imports
+    relative_parts = ["."] * (up_levels + 1) + down_parts
+    return ".".join(relative_parts)
+
+
+@dataclass(slots=True)
 class EndpointClass:
     """Represents a complete endpoint class."""
 
@@ -26,11 +199,9 @@ class EndpointClass:
     properties: list[dict[str, Any]] = field(default_factory=list)
     methods: list[dict[str, Any]] = field(default_factory=list)
     call_method: dict[str, Any] | None = None
-    methods: list[dict[str, Any]] = field(default_factory=list)
-    call_method: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointFile:
     """Represents a complete Python file with one or more endpoint classes."""
 
@@ -49,7 +220,7 @@ class EndpointGenerator:
 
     def __init__(self):
         self.generated_classes: set[str] = set()
-        self.class_counter: dict[str, int] = {}  # Will be initialized in _collect_all_endpoints
+        self.class_counter: Counter[str] = Counter()  # Reset in _collect_all_endpoints
         self.endpoint_files: dict[str, EndpointFile] = {}
         self.endpoint_class_names: dict[str, str] = {}  # Map endpoint path to class name
         self.model_name_map: dict[str, str] = {}  # Map base model names to actual names
@@ -69,87 +240,65 @@ class EndpointGenerator:
         """
         self.model_name_map = model_name_map  # Store for use in method generation
 
-        # First pass: collect all endpoints and generate class names
-        self._collect_all_endpoints(endpoints)
+        # Single tree walk: flatten the tree and generate class names.
+        # Names must all exist before classes are built, since a class
+        # references the class names of its children.
+        all_endpoints = self._collect_all_endpoints(endpoints)
 
-        # Second pass: generate actual classes and files
+        # Generate actual classes and files for the endpoints that need them
         self.endpoint_files = {}
+        self._process_endpoints(all_endpoints)
 
-        for endpoint in endpoints:
-            self._process_endpoint_recursive(endpoint)
-
-        # Third pass: create root endpoint classes for each top-level group
+        # Finally, create root endpoint classes for each top-level group
         self._create_root_endpoint_classes(endpoints)
 
         # Convert to list
         return list(self.endpoint_files.values())
 
-    def _collect_all_endpoints(self, endpoints: list[Endpoint]):
-        """First pass: collect all endpoints and pre-generate class names."""
-        # First, collect all base names that need class names
-        all_base_names = set()
-
-        def collect_base_names(endpoint: Endpoint):
-            if endpoint.methods or endpoint.children:
-                base_name = self._get_base_name(endpoint)
-                all_base_names.add(base_name)
-            for child in endpoint.children:
-                collect_base_names(child)
+    def _collect_all_endpoints(self, endpoints: list[Endpoint]) -> list[Endpoint]:
+        """
+        First pass: pre-generate class names for all endpoints.
 
-        for endpoint in endpoints:
-            collect_base_names(endpoint)
+        Names are assigned in schema order with per-base-name counters.
+        Endpoints with neither methods nor children produce no class or
+        file, so they are left out of the result.
 
-        # Sort base names for deterministic ordering
-        sorted_base_names = sorted(all_base_names)
+        Returns:
+            Endpoints that need a class, flattened in the same (pre-)order
+        """
+        self.class_counter = Counter()
+        ordered = []
+        for endpoint in _walk_endpoints(endpoints):
+            if endpoint.methods or endpoint.children:
+                ordered.append(endpoint)
+                self.endpoint_class_names[endpoint.path] = self._generate_class_name(endpoint)
 
-        # Pre-assign counters for each base name
-        self.class_counter = {}
-        for base_name in sorted_base_names:
-            self.class_counter[base_name] = 0
+        return ordered
 
-        # Now generate class names deterministically
+    def _process_endpoints(self, endpoints: list[Endpoint]):
+        """Generate classes for the flattened endpoints and assign them to files."""
         for endpoint in endpoints:
-            self._collect_endpoint_recursive(endpoint)
+            # Generate class for this endpoint
+            endpoint_class = self._generate_endpoint_class(endpoint)
 
-    def _collect_endpoint_recursive(self, endpoint: Endpoint):
-        """Recursively collect endpoint and generate its class name."""
-        if endpoint.methods or endpoint.children:
-            # Generate class name deterministically
-            class_name = self._generate_class_name(endpoint)
-            self.endpoint_class_names[endpoint.path] = class_name
+            # Check if this is a root endpoint (only one path part, like "/nodes")
+            is_root_endpoint = len(_split_path(endpoint.path)) == 1
 
-        # Process children
-        for child in endpoint.children:
-            self._collect_endpoint_recursive(child)
-
-    def _process_endpoint_recursive(self, endpoint: Endpoint, parent_path: str = ""):
-        """Process endpoint and its children recursively."""
-        # Generate class for this endpoint
-        endpoint_class = self._generate_endpoint_class(endpoint)
-
-        # Check if this is a root endpoint (only one path part, like "/nodes")
-        path_parts = [p for p in endpoint.path.strip("/").split("/") if p]
-        is_root_endpoint = len(path_parts) == 1
-
-        if (endpoint_class or endpoint.children) and not is_root_endpoint:
-            # Determine file path for this endpoint
-            file_path = self._get_file_path(endpoint)
-
-            # Create or get endpoint file
-            if file_path not in self.endpoint_files:
-                self.endpoint_files[file_path] = EndpointFile(
-                    file_path=file_path,
-                    classes=[],
-                    imports="",
-                )
+            if (endpoint_class or endpoint.children) and not is_root_endpoint:
+                # Determine file path for this endpoint
+                file_path = self._get_file_path(endpoint)
 
-            # Add class if it exists
-            if endpoint_class:
-                self.endpoint_files[file_path].classes.append(endpoint_class)
+                # Create or get endpoint file
+                if file_path not in self.endpoint_files:
+                    self.endpoint_files[file_path] = EndpointFile(
+                        file_path=file_path,
+                        classes=[],
+                        imports="",
+                    )
 
-        # Process children recursively
-        for child in endpoint.children:
-            self._process_endpoint_recursive(child, endpoint.path)
+                # Add class if it exists
+                if endpoint_class:
+                    self.endpoint_files[file_path].classes.append(endpoint_class)
 
     def generate_endpoint_file(self, endpoint: Endpoint, children: list[Endpoint]) -> str:
         """
@@ -180,118 +329,64 @@ class EndpointGenerator:
         # Collect imports
         imports = self._collect_imports(classes)
 
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent.parent / "templates"
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        template = env.get_template("endpoint.py.jinja")
-
         # Render template
-        content = template.render(
-            classes=classes,
-            imports=imports,
-        )
-
-        return content
+        return _render_file(classes, imports)
 
-    def write_endpoints(self, endpoint_files: list[EndpointFile], output_dir: Path):
+    def write_endpoints(
+        self,
+        endpoint_files: list[EndpointFile],
+        output_dir: Path,
+        max_workers: int | None = None,
+    ):
         """
         Write generated endpoint files to disk.
 
         Args:
             endpoint_files: List of EndpointFile objects to write
             output_dir: Base output directory (e.g., prmxctrl/endpoints)
+            max_workers: Number of worker processes to render templates in.
+                By default templates are rendered in this process.
         """
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent.parent / "templates"
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        template = env.get_template("endpoint.py.jinja")
-
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Track which directories need __init__.py
-        directories_created = set()
+        # Track the module files written to each directory, for __init__.py
+        dir_files: defaultdict[Path, list[str]] = defaultdict(list)
 
-        # Write each endpoint file
+        # Prepare directories and imports for each endpoint file
+        file_paths = []
         for endpoint_file in endpoint_files:
             # Create directory structure if needed
             file_path = output_dir / endpoint_file.file_path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            directories_created.add(file_path.parent)
+            if file_path.parent not in dir_files:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+            dir_files[file_path.parent].append(file_path.name)
+            file_paths.append(file_path)
 
-            # Update imports for all files in this directory
+            # Collect imports from the file's current classes
             endpoint_file.imports = self._collect_imports(endpoint_file.classes)
 
-            # Render template
-            content = template.render(
-                classes=endpoint_file.classes,
-                imports=endpoint_file.imports,
-            )
+        # Render templates; rendering is CPU-bound and independent per file,
+        # so callers may opt into spreading it over worker processes
+        all_classes = [endpoint_file.classes for endpoint_file in endpoint_files]
+        all_imports = [endpoint_file.imports for endpoint_file in endpoint_files]
+        if max_workers is not None and max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                chunksize = max(1, len(endpoint_files) // (max_workers * 4))
+                contents = list(
+                    executor.map(_render_file, all_classes, all_imports, chunksize=chunksize)
+                )
+        else:
+            contents = list(map(_render_file, all_classes, all_imports))
+        rendered = dict(zip(file_paths, contents, strict=True))
 
-            # Write file
-            file_path.write_text(content)
+        # Write files; this is I/O-bound, so threads overlap the syscalls
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(write_file, rendered.keys(), rendered.values()))
 
         # Generate __init__.py files for all directories
-        for directory in sorted(directories_created):
-            self._write_init_file(directory)
-
-    def _write_init_file(self, directory: Path):
-        """Write __init__.py file for a directory."""
-        init_file = directory / "__init__.py"
-
-        # Collect all Python files in this directory (not subdirectories)
-        python_files = []
-        for item in directory.iterdir():
-            if item.is_file() and item.suffix == ".py" and item.name != "__init__.py":
-                python_files.append(item)
-
-        # Generate imports
-        imports = []
-        all_exports = []
-
-        for py_file in sorted(python_files):
-            module_name = py_file.stem
-
-            # Check if this is a root module (like cluster.py for cluster/ directory)
-            if py_file.name == f"{directory.name}.py":
-                # This is the root file, import the main class
-                root_class_name = directory.name.replace("-", "_").capitalize() + "Endpoints"
-                imports.append(f"from .{module_name} import {root_class_name}")
-                all_exports.append(root_class_name)
-            else:
-                # Import the module
-                imports.append(f"from . import {module_name}")
-                all_exports.append(module_name)
-
-        # Create __init__.py content
-        content = '''"""
-Auto-generated endpoint module.
-
-This module contains hierarchical endpoint classes for Proxmox VE API access.
-DO NOT EDIT MANUALLY
-"""
-
-'''
-
-        if imports:
-            content += "\n".join(imports) + "\n\n"
-
-            if all_exports:
-                content += "__all__ = [\n"
-                for export in all_exports:
-                    content += f'    "{export}",\n'
-                content += "]\n"
-
-        # Write the file
-        init_file.write_text(content)
+        for directory in sorted(dir_files):
+            self._write_init_file(directory, dir_files[directory])
 
     def _get_file_path(self, endpoint: Endpoint) -> str:
         """
@@ -307,111 +402,7 @@ DO NOT EDIT MANUALLY
             /nodes/{node}/qemu -> nodes/node_item/qemu.py
             /nodes/{node}/qemu/{vmid} -> nodes/node_item/qemu/vmid_item/_item.py
         """
-        path_parts = [p for p in endpoint.path.strip("/").split("/") if p]
-
-        if not path_parts:
-            return "common.py"
-
-        # Convert path parts to valid Python identifiers
-        # Replace {param} with param_item for valid directory names
-        converted_parts = []
-        for p in path_parts:
-            if p.startswith("{") and p.endswith("}"):
-                # {node} -> node_item
-                param_name = p.strip("{}")
-                # Avoid Python keywords
-                if param_name in {
-                    "False",
-                    "None",
-                    "True",
-                    "and",
-                    "as",
-                    "assert",
-                    "async",
-                    "await",
-                    "break",
-                    "class",
-                    "continue",
-                    "def",
-                    "del",
-                    "elif",
-                    "else",
-                    "except",
-                    "finally",
-                    "for",
-                    "from",
-                    "global",
-                    "if",
-                    "import",
-                    "in",
-                    "is",
-                    "lambda",
-                    "nonlocal",
-                    "not",
-                    "or",
-                    "pass",
-                    "raise",
-                    "return",
-                    "try",
-                    "while",
-                    "with",
-                    "yield",
-                }:
-                    param_name += "_"
-                converted_parts.append(f"{param_name}_item")
-            else:
-                # Regular parts: replace hyphens with underscores and avoid keywords
-                part_name = p.replace("-", "_")
-                if part_name in {
-                    "False",
-                    "None",
-                    "True",
-                    "and",
-                    "as",
-                    "assert",
-                    "async",
-                    "await",
-                    "break",
-                    "class",
-                    "continue",
-                    "def",
-                    "del",
-                    "elif",
-                    "else",
-                    "except",
-                    "finally",
-                    "for",
-                    "from",
-                    "global",
-                    "if",
-                    "import",
-                    "in",
-                    "is",
-                    "lambda",
-                    "nonlocal",
-                    "not",
-                    "or",
-                    "pass",
-                    "raise",
-                    "return",
-                    "try",
-                    "while",
-                    "with",
-                    "yield",
-                }:
-                    part_name += "_"
-                converted_parts.append(part_name)
-
-        # Check if this endpoint has path parameters
-        if endpoint.path_params:
-            # Item accessor: use _item.py in the appropriate directory
-            result_parts = converted_parts + ["_item"]
-            filename = "/".join(result_parts) + ".py"
-        else:
-            # Regular endpoint: use path as module
-            filename = "/".join(converted_parts) + ".py"
-
-        return filename
+        return _file_path_for(endpoint.path, bool(endpoint.path_params))
 
     def _calculate_relative_import(self, from_path: str, to_path: str) -> str:
         """
@@ -422,28 +413,7 @@ DO NOT EDIT MANUALLY
             from: nodes/node_item/_item.py, to: nodes/node_item/qemu/_item.py -> .qemu._item
             from: nodes/node_item/qemu/_item.py, to: nodes/node_item/qemu/config/_item.py -> .config._item
         """
-        from_parts = from_path.replace(".py", "").split("/")
-        to_parts = to_path.replace(".py", "").split("/")
-
-        # Directory path for the from file (excluding the filename)
-        from_dir_parts = from_parts[:-1] if from_parts else []
-        to_file_parts = to_parts
-
-        # Find common prefix between directory paths
-        common_len = 0
-        for i, (from_dir, to_file) in enumerate(zip(from_dir_parts, to_file_parts)):
-            if from_dir == to_file:
-                common_len = i + 1
-            else:
-                break
-
-        # Calculate relative path
-        up_levels = len(from_dir_parts) - common_len
-        down_parts = to_file_parts[common_len:]
-
-        # Always include at least one "." for relative imports
-        relative_parts = ["."] * (up_levels + 1) + down_parts
-        return ".".join(relative_parts)
+        return _relative_import(from_path, to_path)
 
     def _generate_endpoint_class(self, endpoint: Endpoint) -> EndpointClass | None:
         """Generate an endpoint class for a single endpoint."""
@@ -465,7 +435,7 @@ DO NOT EDIT MANUALLY
         # Generate properties for direct non-parametrized children
         for child in endpoint.children:
             # Only add properties for non-parametrized children (text doesn't contain {param})
-            if "{" not in child.text and "}" not in child.text:
+            if not child.is_param:
                 prop_info = self._generate_property(endpoint, child)
                 endpoint_class.properties.append(prop_info)
 
@@ -482,10 +452,8 @@ DO NOT EDIT MANUALLY
 
         # Generate __call__ method if endpoint has children with path parameters
         # Only for collection endpoints (endpoints without path parameters in their text)
-        if "{" not in endpoint.text and "}" not in endpoint.text:
-            parametrized_children = [
-                child for child in endpoint.children if "{" in child.text or "}" in child.text
-            ]
+        if not endpoint.is_param:
+            parametrized_children = [child for child in endpoint.children if child.is_param]
             if parametrized_children:
                 endpoint_class.call_method = self._generate_call_method(parametrized_children[0])
 
@@ -524,87 +492,10 @@ DO NOT EDIT MANUALLY
             response_model = self.model_name_map.get(base_name)
 
         # Generate return statement
-        if method_name == "GET":
-            if param_model:
-                return_statement = "return await self._get(params=params.model_dump(exclude_none=True, by_alias=True) if params else None)"
-            else:
-                return_statement = "return await self._get()"
-        elif method_name == "POST":
-            if param_model:
-                return_statement = "return await self._post(data=params.model_dump(exclude_none=True, by_alias=True) if params else None)"
-            else:
-                return_statement = "return await self._post()"
-        elif method_name == "PUT":
-            if param_model:
-                return_statement = "return await self._put(data=params.model_dump(exclude_none=True, by_alias=True) if params else None)"
-            else:
-                return_statement = "return await self._put()"
-        elif method_name == "DELETE":
-            return_statement = "return await self._delete()"
-        else:
-            return_statement = "# Unknown HTTP method"
-
-        return {
-            "name": python_method_name,
-            "http_method": method_name,
-            "param_model": param_model,
-            "response_model": response_model,
-            "description": method.description or f"{method_name.upper()} operation",
-            "return_statement": return_statement,
-        }
-
-    def _generate_method_dict(
-        self,
-        endpoint: Endpoint,
-        method_name: str,
-        method: Method,
-        forbidden_names: set[str] | None = None,
-    ) -> dict[str, Any] | None:
-        """Generate method dict for a single method (used by root classes)."""
-        forbidden_names = forbidden_names or set()
-
-        # method_name is already the HTTP method like "GET"
-        python_method_name = self._get_method_name(method)
-
-        # Avoid conflicts with property names
-        if python_method_name in forbidden_names:
-            if method.method == "GET":
-                python_method_name = "get"
-            else:
-                python_method_name += "_"
-
-        # Determine parameter model
-        param_model = None
-        if method.parameters:
-            base_name = self._generate_base_model_name(endpoint, method_name, "Request")
-            param_model = self.model_name_map.get(base_name)
-
-        # Determine response model
-        response_model = None
-        if method.returns and method.returns.type != "null":
-            base_name = self._generate_base_model_name(endpoint, method_name, "Response")
-            response_model = self.model_name_map.get(base_name)
-
-        # Generate return statement
-        if method_name == "GET":
-            if param_model:
-                return_statement = "return await self._get(params=params.model_dump(exclude_none=True, by_alias=True) if params else None)"
-            else:
-                return_statement = "return await self._get()"
-        elif method_name == "POST":
-            if param_model:
-                return_statement = "return await self._post(data=params.model_dump(exclude_none=True, by_alias=True) if params else None)"
-            else:
-                return_statement = "return await self._post()"
-        elif method_name == "PUT":
-            if param_model:
-                return_statement = "return await self._put(data=params.model_dump(exclude_none=True, by_alias=True) if params else None)"
-            else:
-                return_statement = "return await self._put()"
-        elif method_name == "DELETE":
-            return_statement = "return await self._delete()"
-        else:
-            return_statement = "# Unknown HTTP method"
+        with_params, without_params = _RETURN_STATEMENTS.get(
+            method_name, ("# Unknown HTTP method", "# Unknown HTTP method")
+        )
+        return_statement = with_params if param_model else without_params
 
         return {
             "name": python_method_name,
@@ -619,47 +510,7 @@ DO NOT EDIT MANUALLY
         self, current_endpoint: Endpoint, child_endpoint: Endpoint
     ) -> dict[str, Any]:
         """Generate a property for accessing child endpoints."""
-        prop_name = child_endpoint.text.replace("-", "_")
-
-        # Avoid Python keywords
-        if prop_name in {
-            "False",
-            "None",
-            "True",
-            "and",
-            "as",
-            "assert",
-            "async",
-            "await",
-            "break",
-            "class",
-            "continue",
-            "def",
-            "del",
-            "elif",
-            "else",
-            "except",
-            "finally",
-            "for",
-            "from",
-            "global",
-            "if",
-            "import",
-            "in",
-            "is",
-            "lambda",
-            "nonlocal",
-            "not",
-            "or",
-            "pass",
-            "raise",
-            "return",
-            "try",
-            "while",
-            "with",
-            "yield",
-        }:
-            prop_name += "_"
+        prop_name = _sanitize(child_endpoint.text)
 
         # Get class name, generating it if not already cached
         if child_endpoint.path in self.endpoint_class_names:
@@ -679,6 +530,10 @@ DO NOT EDIT MANUALLY
         if current_file_path.endswith("/_item.py"):
             import_path = f".{prop_name}._item"
 
+        # The same names and import paths recur across many files; share them
+        prop_name = sys.intern(prop_name)
+        import_path = sys.intern(import_path)
+
         return {
             "name": prop_name,
             "class": class_name,
@@ -708,43 +563,7 @@ DO NOT EDIT MANUALLY
             param_name = "id"  # Default fallback
 
         # Avoid Python keywords
-        if param_name in {
-            "False",
-            "None",
-            "True",
-            "and",
-            "as",
-            "assert",
-            "async",
-            "await",
-            "break",
-            "class",
-            "continue",
-            "def",
-            "del",
-            "elif",
-            "else",
-            "except",
-            "finally",
-            "for",
-            "from",
-            "global",
-            "if",
-            "import",
-            "in",
-            "is",
-            "lambda",
-            "nonlocal",
-            "not",
-            "or",
-            "pass",
-            "raise",
-            "return",
-            "try",
-            "while",
-            "with",
-            "yield",
-        }:
+        if param_name in _PY_KEYWORDS:
             param_name += "_"
 
         item_class_name = self.endpoint_class_names.get(child_endpoint.path)
@@ -754,7 +573,7 @@ DO NOT EDIT MANUALLY
 
         # Determine import path for the child class
         # For parametrized children, the item is in {param_name}_item/_item.py
-        import_path = f".{param_name}_item._item"
+        import_path = sys.intern(f".{param_name}_item._item")
 
         # Determine parameter type
         param_type = "str"  # Default
@@ -794,56 +613,14 @@ DO NOT EDIT MANUALLY
 
         # Sanitize method name to be valid Python identifier
         if method_name:
-            method_name = method_name.replace("-", "_")
-
-            # Ensure it's not a Python keyword
-            python_keywords = {
-                "and",
-                "as",
-                "assert",
-                "async",
-                "await",
-                "break",
-                "class",
-                "continue",
-                "def",
-                "del",
-                "elif",
-                "else",
-                "except",
-                "False",
-                "finally",
-                "for",
-                "from",
-                "global",
-                "if",
-                "import",
-                "in",
-                "is",
-                "lambda",
-                "None",
-                "nonlocal",
-                "not",
-                "or",
-                "pass",
-                "raise",
-                "return",
-                "True",
-                "try",
-                "while",
-                "with",
-                "yield",
-            }
-
-            if method_name in python_keywords:
-                method_name = f"{method_name}_"
+            method_name = _sanitize(method_name)
 
         return method_name if method_name else "execute"
 
     def _get_base_name(self, endpoint: Endpoint) -> str:
         """Get the base name for class name generation."""
         # Use endpoint path to create meaningful name
-        path_parts = [p for p in endpoint.path.split("/") if p and not p.startswith("{")]
+        path_parts = _name_segments(endpoint.path)
 
         if path_parts:
             # Capitalize each part, converting hyphens to underscores first
@@ -859,18 +636,16 @@ DO NOT EDIT MANUALLY
         """Generate class name from endpoint using deterministic counters."""
         base_name = self._get_base_name(endpoint)
 
-        # Initialize counter if not exists (for testing or standalone usage)
-        if base_name not in self.class_counter:
-            self.class_counter[base_name] = 0
-
-        # Get the next available number for this base name
-        counter = self.class_counter[base_name]
-        self.class_counter[base_name] += 1
+        # Get the next available number for this base name (Counter starts at 0)
+        class_counter = self.class_counter
+        counter = class_counter[base_name]
+        class_counter[base_name] = counter + 1
 
         if counter == 0:
             class_name = base_name
         else:
             class_name = f"{base_name}{counter}"
+        class_name = sys.intern(class_name)
 
         # Mark as used (for backward compatibility)
         self.generated_classes.add(class_name)
@@ -880,7 +655,7 @@ DO NOT EDIT MANUALLY
     def _generate_model_name(self, endpoint: Endpoint, method_name: str, suffix: str) -> str:
         """Generate model name for request/response models."""
         # Use endpoint path components to create a meaningful name
-        path_parts = [p for p in endpoint.path.split("/") if p and not p.startswith("{")]
+        path_parts = _name_segments(endpoint.path)
 
         if path_parts:
             # Use the last meaningful path component
@@ -896,54 +671,48 @@ DO NOT EDIT MANUALLY
 
     def _collect_imports(self, classes: list[EndpointClass]) -> str:
         """Collect all imports needed for the endpoint file."""
-        imports = []
-
-        # Base import
-        imports.append("from prmxctrl.base.endpoint_base import EndpointBase")
-        imports.append("from typing import Optional")
-
         # Collect model imports (endpoint class imports are now done inline)
-        model_imports = set()
-
-        for endpoint_class in classes:
-            # No longer collect imports for __call__ method - they use inline imports
-
-            for method in endpoint_class.methods:
-                if method["param_model"]:
-                    model_imports.add(method["param_model"])
-                if method["response_model"]:
-                    model_imports.add(method["response_model"])
-
-        # Group model imports
-        if model_imports:
-            imports.append("from prmxctrl.models import (")
+        model_imports = {
+            model_name
+            for endpoint_class in classes
+            for method in endpoint_class.methods
+            for model_name in (method["param_model"], method["response_model"])
+            if model_name
+        }
 
-            for model_name in sorted(model_imports):
-                imports.append(f"    {model_name},")
+        if not model_imports:
+            return _BASE_IMPORTS
 
-            imports.append(")")
+        return "\n".join(
+            [
+                _BASE_IMPORTS,
+                "from prmxctrl.models import (",
+                *(f"    {model_name}," for model_name in sorted(model_imports)),
+                ")",
+            ]
+        )
 
-        return "\n".join(imports)
+    def _write_init_file(self, directory: Path, filenames: list[str]):
+        """
+        Write __init__.py file for a directory.
 
-    def _write_init_file(self, directory: Path):
-        """Write __init__.py file for a directory."""
+        Args:
+            directory: Directory to write the __init__.py into
+            filenames: Names of the module files generated in that directory
+        """
         init_file = directory / "__init__.py"
 
-        # Collect all Python files in this directory (not subdirectories)
-        python_files = []
-        for item in directory.iterdir():
-            if item.is_file() and item.suffix == ".py" and item.name != "__init__.py":
-                python_files.append(item)
-
         # Generate imports
         imports = []
         all_exports = []
 
-        for py_file in sorted(python_files):
-            module_name = py_file.stem
+        for filename in sorted(filenames):
+            if filename == "__init__.py":
+                continue
+            module_name = filename.removesuffix(".py")
 
             # Check if this is a root module (like cluster.py for cluster/ directory)
-            if py_file.name == f"{directory.name}.py":
+            if filename == f"{directory.name}.py":
                 # This is the root file, import the main class
                 root_class_name = directory.name.replace("-", "_").capitalize() + "Endpoints"
                 imports.append(f"from .{module_name} import {root_class_name}")
@@ -954,26 +723,19 @@ DO NOT EDIT MANUALLY
                 all_exports.append(module_name)
 
         # Create __init__.py content
-        content = '''"""
-Auto-generated endpoint module.
-
-This module contains hierarchical endpoint classes for Proxmox VE API access.
-DO NOT EDIT MANUALLY
-"""
-
-'''
-
+        parts = [_INIT_HEADER]
         if imports:
-            content += "\n".join(imports) + "\n\n"
+            parts.append("\n".join(imports))
+            parts.append("\n\n")
 
             if all_exports:
-                content += "__all__ = [\n"
-                for export in all_exports:
-                    content += f'    "{export}",\n'
-                content += "]\n"
+                parts.append("__all__ = [\n")
+                parts.extend(f'    "{export}",\n' for export in all_exports)
+                parts.append("]\n")
+        content = "".join(parts)
 
         # Write the file
-        init_file.write_text(content)
+        write_file(init_file, content)
 
     def _create_root_endpoint_classes(self, endpoints: list[Endpoint]):
         """Create root endpoint classes that aggregate child endpoints."""
@@ -982,10 +744,9 @@ DO NOT EDIT MANUALLY
         root_groups = defaultdict(list)
 
         for endpoint in endpoints:
-            path_parts = endpoint.path.strip("/").split("/")
-            if path_parts and path_parts[0]:
-                root_name = path_parts[0]
-                root_groups[root_name].append(endpoint)
+            path_parts = _split_path(endpoint.path)
+            if path_parts:
+                root_groups[path_parts[0]].append(endpoint)
 
         # Create root class for each group
         for root_name, group_endpoints in root_groups.items():
@@ -1004,61 +765,54 @@ DO NOT EDIT MANUALLY
             methods=[],
         )
 
-        # Find the root endpoint and check if it has parametrized children
-        root_endpoint = None
+        # Split the group into the root endpoint(s) and child endpoints in one pass
+        root_path = f"/{root_name}"
+        root_endpoints = []
+        child_endpoints = []
         for ep in endpoints:
-            if ep.path == f"/{root_name}":
-                root_endpoint = ep
-                break
+            (root_endpoints if ep.path == root_path else child_endpoints).append(ep)
 
         # Add __call__ method if the root endpoint has parametrized children
-        if root_endpoint and any(child.path_params for child in root_endpoint.children):
-            # Find the first parametrized child
+        if root_endpoints:
+            # Find the first parametrized child of the root endpoint
             parametrized_child = next(
-                (child for child in root_endpoint.children if child.path_params), None
+                (child for child in root_endpoints[0].children if child.path_params), None
             )
             if parametrized_child:
                 root_class.call_method = self._generate_call_method(parametrized_child)
 
         # Add properties for each child endpoint
-        for endpoint in endpoints:
-            if endpoint.path == f"/{root_name}":
-                # Skip root endpoint for now, add methods later
-                pass
-            else:
-                # Child endpoint - add as property
-                child_class_name = self.endpoint_class_names.get(endpoint.path)
-                if child_class_name:
-                    # Get the property name from the endpoint path
-                    path_parts = endpoint.path.strip("/").split("/")
-                    if len(path_parts) > 1:
-                        prop_name = path_parts[1]  # Second part after root
-                        if "{" in prop_name:
-                            prop_name = "_item"  # Dynamic path parameter
-                        else:
-                            prop_name = prop_name.replace("-", "_")
-
-                        root_class.properties.append(
-                            {
-                                "name": prop_name,
-                                "type": child_class_name,
-                                "description": f"Access {endpoint.path} endpoints",
-                            }
-                        )
+        for endpoint in child_endpoints:
+            child_class_name = self.endpoint_class_names.get(endpoint.path)
+            if child_class_name:
+                # Get the property name from the endpoint path
+                path_parts = _split_path(endpoint.path)
+                if len(path_parts) > 1:
+                    prop_name = path_parts[1]  # Second part after root
+                    if "{" in prop_name:
+                        prop_name = "_item"  # Dynamic path parameter
+                    else:
+                        prop_name = prop_name.replace("-", "_")
+
+                    root_class.properties.append(
+                        {
+                            "name": prop_name,
+                            "type": child_class_name,
+                            "description": f"Access {endpoint.path} endpoints",
+                        }
+                    )
 
         # Collect forbidden names (property names)
         forbidden_names = {prop["name"] for prop in root_class.properties}
 
         # Add methods for root endpoint
-        for endpoint in endpoints:
-            if endpoint.path == f"/{root_name}":
-                if endpoint.methods:
-                    for method_name, method in endpoint.methods.items():
-                        method_dict = self._generate_method_dict(
-                            endpoint, method_name, method, forbidden_names=forbidden_names
-                        )
-                        if method_dict:
-                            root_class.methods.append(method_dict)
+        for endpoint in root_endpoints:
+            for method_name, method in endpoint.methods.items():
+                method_dict = self._generate_method(
+                    endpoint, method_name, method, forbidden_names=forbidden_names
+                )
+                if method_dict:
+                    root_class.methods.append(method_dict)
 
         # Create file for root class
         file_path = f"{root_name}/__init__.py"
@@ -1073,32 +827,9 @@ DO NOT EDIT MANUALLY
         self.endpoint_files[file_path].classes.insert(0, root_class)  # Insert at beginning
 
     def _generate_base_model_name(self, endpoint: Endpoint, method_name: str, suffix: str) -> str:
-        """Generate the base model name without counter."""
-        # Use endpoint path to create a unique name
-        path = (
-            endpoint.path.replace("/", "_")
-            .replace("{", "")
-            .replace("}", "")
-            .replace("-", "_")
-            .title()
-        )
-        if path.startswith("_"):
-            path = path[1:]
-
-        # Add method and suffix
-        method_part = method_name.upper()
-        model_name = f"{path}{method_part}{suffix}"
-
-        return model_name
+        """Generate the base model name without counter (matches ModelGenerator)."""
+        return base_model_name(endpoint.path, method_name, suffix)
 
     def _extract_class_names_from_file(self, content: str) -> list[str]:
         """Extract class names from Python file content."""
-
-        class_names = []
-        # Match class definitions
-        class_pattern = r"^class\s+(\w+)\s*\("
-        for line in content.split("\n"):
-            match = re.match(class_pattern, line.strip())
-            if match:
-                class_names.append(match.group(1))
-        return class_names
+        return _CLASS_DEF_RE.findall(content)
@@ -5,18 +5,99 @@ This module generates Pydantic v2 models from parsed schema endpoints,
 creating type-safe request and response models.
 """
 
+import functools
+import json
+import keyword
+import os
 import re
+import sys
 from collections import defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from numbers import Number
 from pathlib import Path
+from typing import Any
 
 import jinja2
 
-from ..parse_schema import Endpoint, Method
+from ..parse_schema import Endpoint, Method, Parameter, Response
+from ._common import base_model_name, write_file
 from .type_mapper import TypeMapper
 
+# Characters not allowed in a Python identifier
+_INVALID_FIELD_CHARS_RE = re.compile(r"[^a-zA-Z0-9_]")
 
-@dataclass
+
+@functools.cache
+def _module_name_for(api_path: str) -> str:
+    """Get the models module name for an API path (cached per path)."""
+    # Use the first path component as module name
+    return sys.intern(api_path.strip("/").partition("/")[0] or "common")
+
+
+# Names in a type annotation that the models module must import
+_IMPORT_TOKEN_RE = re.compile(r"Optional\[|Literal\[|Any|Proxmox")
+
+
+@functools.cache
+def _annotation_imports(type_annotation: str) -> frozenset[str]:
+    """
+    Return the importable names a type annotation uses (cached per annotation).
+
+    Typing names come back bare ("Optional", "Literal", "Any"); "Proxmox"
+    stands for the custom types from base.types.
+    """
+    return frozenset(token.rstrip("[") for token in _IMPORT_TOKEN_RE.findall(type_annotation))
+
+
+@functools.cache
+def _sanitize_field_name(name: str) -> str:
+    """Sanitize a parameter name into a valid Python identifier (cached per name)."""
+    # Replace invalid characters; ASCII identifiers, the common case, have none
+    if not (name.isascii() and name.isidentifier()):
+        name = _INVALID_FIELD_CHARS_RE.sub("_", name)
+
+    # Ensure it doesn't start with a digit
+    if name and name[0].isdigit():
+        name = f"field_{name}"
+
+    # Ensure it's not a Python keyword
+    if keyword.iskeyword(name):
+        name = f"{name}_"
+
+    return name
+
+
+# Docstring header of the generated models/__init__.py
+_INIT_HEADER = '''"""
+Generated Pydantic models for Proxmox VE API.
+
+This module contains all auto-generated Pydantic v2 models for request and response
+validation across all API endpoints.
+"""
+
+'''
+
+# Jinja2 environment and model template, compiled once per process.
+# Compiled template bytecode is also cached on disk across generator runs.
+_TEMPLATE_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).parent.parent / "templates"),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
+)
+_MODEL_TEMPLATE = _TEMPLATE_ENV.get_template("model.py.jinja")
+
+# Closing lines of every generated model class
+_MODEL_CONFIG = (
+    "\n"
+    '    model_config = ConfigDict(extra="forbid", validate_assignment=True, populate_by_name=True)\n'
+    "\n"
+)
+
+
+@dataclass(slots=True)
 class ModelField:
     """Represents a field in a Pydantic model."""
 
@@ -27,9 +108,12 @@ class ModelField:
     original_name: str | None = (
         None  # Original API parameter name (may differ from Python field name)
     )
+    # Rendered source of this field, filled in on first render so that
+    # rendering a model again does not format it again
+    source: str | None = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class PydanticModel:
     """Represents a complete Pydantic model."""
 
@@ -39,7 +123,7 @@ class PydanticModel:
     base_class: str = "BaseModel"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelFile:
     """Represents a complete Python file with multiple models."""
 
@@ -48,6 +132,85 @@ class ModelFile:
     imports: list[str]
 
 
+def _to_json(value: Any) -> str:
+    """Serialize a value like Jinja's tojson filter (sorted keys, HTML-safe)."""
+    return (
+        json.dumps(value, sort_keys=True)
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+        .replace("'", "\\u0027")
+    )
+
+
+def _format_field_value(value: Any) -> str:
+    """Format a Field() keyword value the way model.py.jinja does."""
+    if isinstance(value, str):
+        return _to_json(value)
+    if isinstance(value, Number):  # Includes bool, rendered as True/False
+        return str(value)
+    return _to_json(value)
+
+
+def _field_source(model_field: ModelField) -> str:
+    """Return the rendered Field() declaration of a model field, formatting it once."""
+    source = model_field.source
+    if source is None:
+        parts = [f"    {model_field.name}: {model_field.type_annotation} = Field(\n"]
+        parts.extend(
+            f"        {key}={_format_field_value(value)},\n"
+            for key, value in model_field.field_kwargs.items()
+            if value is not None
+        )
+        parts.append("    )\n")
+        source = model_field.source = "".join(parts)
+    return source
+
+
+def _render_model_file(
+    module_name: str, imports: list[str], models: list[PydanticModel], use_jinja: bool = False
+) -> str:
+    """
+    Render a models module.
+
+    Emits the same text as model.py.jinja directly with string joins, which
+    is much faster than running the template. Pass use_jinja=True to render
+    through the template instead.
+    """
+    if use_jinja:
+        return _MODEL_TEMPLATE.render(module_name=module_name, imports=imports, models=models)
+
+    header = f'''"""
+Pydantic models for {module_name} API endpoints.
+
+This module contains auto-generated Pydantic v2 models for request and response
+validation in the {module_name} API endpoints.
+"""
+
+'''
+    parts = [header]
+    parts.extend(f"{import_stmt}\n" for import_stmt in imports)
+    parts.append("\n")
+
+    for model in models:
+        docstring = model.docstring or f"Auto-generated model for {module_name} API."
+        parts.append(
+            f'class {model.name}({model.base_class}):\n    """\n    {docstring}\n    """\n'
+        )
+        parts.extend(map(_field_source, model.fields))
+        parts.append(_MODEL_CONFIG)
+
+    return "".join(parts)
+
+
+def _render_and_write(model_file: ModelFile, output_dir: Path, use_jinja: bool = False) -> None:
+    """Render one model file and write it into output_dir."""
+    content = _render_model_file(
+        model_file.filename.replace(".py", ""), model_file.imports, model_file.models, use_jinja
+    )
+    write_file(output_dir / model_file.filename, content)
+
+
 class ModelGenerator:
     """
     Generates Pydantic v2 models from parsed Proxmox API schema.
@@ -56,10 +219,21 @@ class ModelGenerator:
     for return types, with proper type annotations and validation.
     """
 
-    def __init__(self):
+    def __init__(self, use_jinja: bool = False):
+        """
+        Initialize the model generator.
+
+        Args:
+            use_jinja: Render model files through model.py.jinja instead of
+                the direct string renderer
+        """
+        self.use_jinja = use_jinja
         self.type_mapper = TypeMapper()
         self.generated_models: dict[str, PydanticModel] = {}
         self.model_counter = defaultdict(int)
+        # Models already built per (endpoint path, method name, kind), stored
+        # with the Method they were built from
+        self._model_cache: dict[tuple[str, str, str], tuple[Method, PydanticModel | None]] = {}
 
     def generate_models(self, endpoints: list[Endpoint]) -> list[ModelFile]:
         """
@@ -71,11 +245,15 @@ class ModelGenerator:
         Returns:
             List of ModelFile objects containing the generated models
         """
-        # Collect all models by module
+        # Collect all models by module, with the field types each module uses
         models_by_module: dict[str, list[PydanticModel]] = defaultdict(list)
+        types_by_module: dict[str, set[str]] = defaultdict(set)
 
-        def process_endpoint(endpoint: Endpoint):
-            """Process a single endpoint and its methods."""
+        # Walk the endpoint tree in pre-order with an explicit stack, so deep
+        # trees cannot hit the recursion limit
+        stack = list(reversed(endpoints))
+        while stack:
+            endpoint = stack.pop()
             module_name = self._get_module_name(endpoint)
 
             # Generate models for each method
@@ -85,34 +263,44 @@ class ModelGenerator:
                     request_model = self._generate_request_model(endpoint, method_name, method)
                     if request_model:
                         models_by_module[module_name].append(request_model)
+                        types_by_module[module_name].update(
+                            field.type_annotation for field in request_model.fields
+                        )
 
                 # Response model
                 if method.returns and method.returns.type != "null":
                     response_model = self._generate_response_model(endpoint, method_name, method)
                     if response_model:
                         models_by_module[module_name].append(response_model)
+                        types_by_module[module_name].update(
+                            field.type_annotation for field in response_model.fields
+                        )
 
             # Process children
-            for child in endpoint.children:
-                process_endpoint(child)
+            stack.extend(reversed(endpoint.children))
 
-        # Process all endpoints
-        for endpoint in endpoints:
-            process_endpoint(endpoint)
-
-        # Convert to ModelFile objects
-        model_files = []
-        for module_name, models in models_by_module.items():
-            if models:  # Only create files with models
-                model_file = self._create_model_file(module_name, models)
-                model_files.append(model_file)
+        # Convert to ModelFile objects (only modules that got models have entries)
+        return [
+            self._create_model_file(module_name, models, types_by_module[module_name])
+            for module_name, models in models_by_module.items()
+        ]
 
-        return model_files
+    def _create_model_file(
+        self, module_name: str, models: list[PydanticModel], types: set[str] | None = None
+    ) -> ModelFile:
+        """
+        Create a ModelFile from a list of models.
 
-    def _create_model_file(self, module_name: str, models: list[PydanticModel]) -> ModelFile:
-        """Create a ModelFile from a list of models."""
+        Args:
+            module_name: Name of the module
+            models: Models in the module
+            types: Field type annotations used by the models, if already collected
+        """
         # Collect all imports needed
-        imports = self._collect_imports(models)
+        if types is None:
+            imports = self._collect_imports(models)
+        else:
+            imports = self._imports_for_types(types)
 
         # Create filename
         filename = f"{module_name}.py"
@@ -121,26 +309,19 @@ class ModelGenerator:
 
     def _collect_imports(self, models: list[PydanticModel]) -> list[str]:
         """Collect all imports needed for the model file."""
-        imports = set()
-        typing_imports = set()
-
-        # Base Pydantic imports
-        imports.add("from pydantic import BaseModel, Field, ConfigDict")
-
-        # Check what typing imports are needed
-        for model in models:
-            for field in model.fields:
-                type_str = field.type_annotation
-                if "Optional[" in type_str:
-                    typing_imports.add("Optional")
-                if "Literal[" in type_str:
-                    typing_imports.add("Literal")
-                # Always include Any since it's commonly used
-                if "Any" in type_str:
-                    typing_imports.add("Any")
-                # If field type contains custom types, add imports
-                if "Proxmox" in type_str:
-                    imports.add("from ..base.types import ProxmoxNode, ProxmoxVMID")
+        return self._imports_for_types(
+            {field.type_annotation for model in models for field in model.fields}
+        )
+
+    def _imports_for_types(self, types: set[str]) -> list[str]:
+        """Collect the imports needed for a set of field type annotations."""
+        imports = {"from pydantic import BaseModel, Field, ConfigDict"}
+        typing_imports = set().union(*map(_annotation_imports, types))
+
+        # If field types contain custom types, add imports
+        if "Proxmox" in typing_imports:
+            typing_imports.discard("Proxmox")
+            imports.add("from ..base.types import ProxmoxNode, ProxmoxVMID")
 
         # Add typing imports if any are needed
         if typing_imports:
@@ -161,6 +342,16 @@ class ModelGenerator:
         Returns:
             Tuple of (generated Python code as string, dict mapping base names to actual names)
         """
+        no_models = f'"""Generated models for {module_name} - no models needed"""\n'
+
+        # Skip the walk entirely when no method has parameters or a return value
+        if not any(
+            method.parameters or (method.returns and method.returns.type != "null")
+            for endpoint in endpoints
+            for method in endpoint.methods.values()
+        ):
+            return no_models, {}
+
         # Generate models for this module
         models = []
         model_name_map = {}
@@ -189,26 +380,13 @@ class ModelGenerator:
                         model_name_map[base_name] = response_model.name
 
         if not models:
-            return f'"""Generated models for {module_name} - no models needed"""\n', {}
+            return no_models, {}
 
         # Collect imports
         imports = self._collect_imports(models)
 
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent.parent / "templates"
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        template = env.get_template("model.py.jinja")
-
-        # Render template
-        content = template.render(
-            module_name=module_name,
-            imports=imports,
-            models=models,
-        )
+        # Render models module
+        content = _render_model_file(module_name, imports, models, self.use_jinja)
 
         return content, model_name_map
 
@@ -220,48 +398,26 @@ class ModelGenerator:
             model_files: List of ModelFile objects to write
             output_dir: Base output directory (e.g., prmxctrl/models)
         """
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent.parent / "templates"
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        template = env.get_template("model.py.jinja")
-
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Collect all model names for __init__.py
-        all_models = []
-
-        # Write each model file
-        for model_file in model_files:
-            # Render template
-            content = template.render(
-                module_name=model_file.filename.replace(".py", ""),
-                imports=model_file.imports,
-                models=model_file.models,
-            )
-
-            # Write file
-            output_path = output_dir / model_file.filename
-            output_path.write_text(content)
+        # Render and write each model file. Threads overlap template rendering
+        # with the file writes, which release the GIL.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_render_and_write, model_file, output_dir, self.use_jinja)
+                for model_file in model_files
+            ]
+            for future in futures:
+                future.result()
 
         # Generate __init__.py
         self._write_init_file(output_dir, model_files)
 
     def _write_init_file(self, output_dir: Path, model_files: list[ModelFile]):
         """Generate models/__init__.py with all exports."""
-        init_content = '''"""
-Generated Pydantic models for Proxmox VE API.
-
-This module contains all auto-generated Pydantic v2 models for request and response
-validation across all API endpoints.
-"""
-
-'''
-
+        parts = [_INIT_HEADER]
         all_models = []
 
         # Add imports for all models grouped by file
@@ -269,23 +425,53 @@ validation across all API endpoints.
             module_name = model_file.filename.replace(".py", "")
             model_names = [model.name for model in model_file.models]
             if model_names:
-                init_content += f"from .{module_name} import {', '.join(model_names)}\n"
+                parts.append(f"from .{module_name} import {', '.join(model_names)}\n")
                 all_models.extend(model_names)
 
         # Add __all__ export
-        init_content += "\n__all__ = [\n"
-        for model_name in sorted(all_models):
-            init_content += f'    "{model_name}",\n'
-        init_content += "]\n"
+        parts.append("\n__all__ = [\n")
+        parts.extend(f'    "{model_name}",\n' for model_name in sorted(all_models))
+        parts.append("]\n")
+        init_content = "".join(parts)
 
         # Write __init__.py
         init_path = output_dir / "__init__.py"
-        init_path.write_text(init_content)
+        write_file(init_path, init_content)
+
+    def _cached_model(
+        self, endpoint: Endpoint, method_name: str, method: Method, kind: str
+    ) -> PydanticModel | None:
+        """
+        Return the model of the given kind for an endpoint method, building it once.
+
+        generate_models and generate_models_file_with_names may both visit the
+        same endpoints; reusing the model keeps names stable and avoids bumping
+        model_counter a second time. A model depends on its endpoint only
+        through the path, so it is reused for the same path and Method object;
+        any other Method gets a new model.
+        """
+        key = (endpoint.path, method_name, kind)
+        cached = self._model_cache.get(key)
+        if cached is not None and cached[0] is method:
+            return cached[1]
+
+        if kind == "Request":
+            model = self._build_request_model(endpoint, method_name, method)
+        else:
+            model = self._build_response_model(endpoint, method_name, method)
+        self._model_cache[key] = (method, model)
+        return model
 
     def _generate_request_model(
         self, endpoint: Endpoint, method_name: str, method: Method
     ) -> PydanticModel | None:
         """Generate a request model for method parameters."""
+        return self._cached_model(endpoint, method_name, method, "Request")
+
+    def _build_request_model(
+        self, endpoint: Endpoint, method_name: str, method: Method
+    ) -> PydanticModel | None:
+        """Build a new request model for method parameters."""
         if not method.parameters:
             return None
 
@@ -293,69 +479,86 @@ validation across all API endpoints.
         base_name = self._generate_base_model_name(endpoint, method_name, "Request")
         model_name = self._ensure_unique_name(base_name)
 
-        fields = []
-        types_used = set()
+        fields = self._build_request_fields(method.parameters)
 
-        for param in method.parameters:
-            # Map parameter type
-            param_spec = {
-                "type": param.type,
-                "format": param.format,
-                "optional": param.optional,
-                "default": param.default,
-                "minimum": param.minimum,
-                "maximum": param.maximum,
-                "maxLength": param.max_length,
-                "pattern": param.pattern,
-                "enum": param.enum,
-                "properties": param.properties,
-            }
-            type_annotation, field_kwargs = self.type_mapper.map_parameter_type(
-                param_spec, param.name
-            )
+        if not fields:
+            return None
+
+        # Create model
+        model = PydanticModel(
+            name=model_name,
+            fields=fields,
+            docstring=f"Request model for {endpoint.path} {method_name.upper()}",
+        )
 
-            # Track types used for imports
-            types_used.add(type_annotation)
+        # Store for potential reuse
+        self.generated_models[model_name] = model
+
+        return model
+
+    def _build_request_fields(self, parameters: list[Parameter]) -> list[ModelField]:
+        """Build new model fields for a list of method parameters."""
+        fields = []
+        for param in parameters:
+            # Map parameter type
+            type_annotation, field_kwargs = self._map_parameter_type(param)
 
             # Add description to field_kwargs if present
             if param.description:
                 field_kwargs["description"] = param.description
 
             # Add serialization_alias if field name differs from original (e.g., hyphens to underscores)
-            sanitized_name = self._sanitize_field_name(param.name)
+            sanitized_name = _sanitize_field_name(param.name)
             if sanitized_name != param.name:
                 # Add alias for serialization (when sending to API)
                 field_kwargs["serialization_alias"] = param.name
 
             # Create field
-            field = ModelField(
+            model_field = ModelField(
                 name=sanitized_name,
                 type_annotation=type_annotation,
                 field_kwargs=field_kwargs,
                 description=param.description,
                 original_name=param.name if sanitized_name != param.name else None,
             )
-            fields.append(field)
+            fields.append(model_field)
 
-        if not fields:
-            return None
+        return fields
 
-        # Create model
-        model = PydanticModel(
-            name=model_name,
-            fields=fields,
-            docstring=f"Request model for {endpoint.path} {method_name.upper()}",
-        )
+    def _map_parameter_type(self, param: Parameter) -> tuple[str, dict[str, Any]]:
+        """
+        Map a parameter to its type annotation and Field kwargs.
 
-        # Store for potential reuse
-        self.generated_models[model_name] = model
+        TypeMapper caches the mapping per distinct spec, since the same specs
+        (node, vmid, storage, ...) recur on many endpoints.
 
-        return model
+        Returns:
+            Tuple of (type annotation, fresh field_kwargs dict the caller may modify)
+        """
+        param_spec = {
+            "type": param.type,
+            "format": param.format,
+            "optional": param.optional,
+            "default": param.default,
+            "minimum": param.minimum,
+            "maximum": param.maximum,
+            "maxLength": param.max_length,
+            "pattern": param.pattern,
+            "enum": param.enum,
+            "properties": param.properties,
+        }
+        return self.type_mapper.map_parameter_type(param_spec, param.name)
 
     def _generate_response_model(
         self, endpoint: Endpoint, method_name: str, method: Method
     ) -> PydanticModel | None:
         """Generate a response model for method returns."""
+        return self._cached_model(endpoint, method_name, method, "Response")
+
+    def _build_response_model(
+        self, endpoint: Endpoint, method_name: str, method: Method
+    ) -> PydanticModel | None:
+        """Build a new response model for method returns."""
         if not method.returns or method.returns.type == "null":
             return None
 
@@ -363,34 +566,20 @@ validation across all API endpoints.
         base_name = self._generate_base_model_name(endpoint, method_name, "Response")
         model_name = self._ensure_unique_name(base_name)
 
-        # For now, create a simple response model
-        # TODO: Handle complex response schemas
-        if method.returns.type == "object":
-            type_annotation = "dict[str, Any]"
-        elif method.returns.type == "array":
-            # Check if items are specified
-            if hasattr(method.returns, "items") and method.returns.items:
-                item_type, _ = self.type_mapper.map_parameter_type(method.returns.items, "item")
-                type_annotation = f"list[{item_type}]"
-            else:
-                type_annotation = "list[Any]"
-        else:
-            # Primitive type
-            type_annotation, _ = self.type_mapper.map_parameter_type(
-                {"type": method.returns.type}, "response"
-            )
+        # Response models are a single 'data' field
+        type_annotation = self._map_response_type(method.returns)
 
-        # Create a simple response model with a single 'data' field
-        field = ModelField(
+        http_method = method_name.upper()
+        data_field = ModelField(
             name="data",
             type_annotation=type_annotation,
-            field_kwargs={"description": f"Response data for {method_name.upper()}"},
+            field_kwargs={"description": f"Response data for {http_method}"},
         )
 
         model = PydanticModel(
             name=model_name,
-            fields=[field],
-            docstring=f"Response model for {endpoint.path} {method_name.upper()}",
+            fields=[data_field],
+            docstring=f"Response model for {endpoint.path} {http_method}",
         )
 
         # Store for potential reuse
@@ -398,93 +587,38 @@ validation across all API endpoints.
 
         return model
 
+    def _map_response_type(self, returns: Response) -> str:
+        """Map a method's return schema to the annotation of its 'data' field."""
+        # TODO: Handle complex response schemas
+        if returns.type == "object":
+            return "dict[str, Any]"
+        if returns.type == "array":
+            # Check if items are specified (items is a declared Response field)
+            if returns.items:
+                item_type, _ = self.type_mapper.map_parameter_type(returns.items, "item")
+                return f"list[{item_type}]"
+            return "list[Any]"
+        # Primitive type
+        type_annotation, _ = self.type_mapper.map_parameter_type({"type": returns.type}, "response")
+        return type_annotation
+
     def _ensure_unique_name(self, base_name: str) -> str:
         """Ensure a model name is unique by adding counter if needed."""
-        counter = self.model_counter[base_name]
-        self.model_counter[base_name] += 1
+        model_counter = self.model_counter
+        counter = model_counter[base_name]
+        model_counter[base_name] = counter + 1
 
-        if counter > 0:
-            return f"{base_name}{counter}"
-        return base_name
+        return f"{base_name}{counter}" if counter else base_name
 
     def _generate_base_model_name(self, endpoint: Endpoint, method_name: str, suffix: str) -> str:
         """Generate the base model name without counter."""
-        # Use endpoint path to create a unique name
-        path = (
-            endpoint.path.replace("/", "_")
-            .replace("{", "")
-            .replace("}", "")
-            .replace("-", "_")
-            .title()
-        )
-        if path.startswith("_"):
-            path = path[1:]
-
-        # Add method and suffix
-        method_part = method_name.upper()
-        model_name = f"{path}{method_part}{suffix}"
-
-        return model_name
+        # Use endpoint path to create a unique name, and add method and suffix
+        return base_model_name(endpoint.path, method_name, suffix)
 
     def _get_module_name(self, endpoint: Endpoint) -> str:
         """Get the module name for an endpoint."""
-        path_parts = endpoint.path.strip("/").split("/")
-
-        # Use the first path component as module name
-        if path_parts and path_parts[0]:
-            return path_parts[0]
-        else:
-            return "common"
+        return _module_name_for(endpoint.path)
 
     def _sanitize_field_name(self, name: str) -> str:
         """Sanitize field names to be valid Python identifiers."""
-        # Replace invalid characters
-        name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
-
-        # Ensure it doesn't start with a digit
-        if name and name[0].isdigit():
-            name = f"field_{name}"
-
-        # Ensure it's not a Python keyword
-        python_keywords = {
-            "and",
-            "as",
-            "assert",
-            "async",
-            "await",
-            "break",
-            "class",
-            "continue",
-            "def",
-            "del",
-            "elif",
-            "else",
-            "except",
-            "False",
-            "finally",
-            "for",
-            "from",
-            "global",
-            "if",
-            "import",
-            "in",
-            "is",
-            "lambda",
-            "None",
-            "nonlocal",
-            "not",
-            "or",
-            "pass",
-            "raise",
-            "return",
-            "True",
-            "try",
-            "while",
-            "with",
-            "yield",
-        }
-
-        if name in python_keywords:
-            name = f"{name}_"
-
-        return name
+        return _sanitize_field_name(name)
@@ -5,8 +5,14 @@ This module handles the conversion of Proxmox API parameter specifications
 to appropriate Python types and Pydantic field definitions.
 """
 
+import functools
+import re
+import sys
+from collections import OrderedDict
+from collections.abc import Mapping
 from enum import Enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 
 class ProxmoxType(Enum):
@@ -33,344 +39,455 @@ class PythonType(Enum):
     NONE = "None"
 
 
-class TypeMapper:
+def _freeze(value: Any) -> Any:
     """
-    Maps Proxmox API parameter specifications to Python/Pydantic types.
+    Convert a schema value into a hashable cache key component.
 
-    Handles type conversion, constraints, and Pydantic Field generation.
+    Scalars are tagged with their type so that e.g. 1, 1.0 and True stay
+    distinct, since they map to different defaults.
     """
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple):
+        return (type(value), tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+# Base annotation per primitive schema type, made permissive for Proxmox API
+# compatibility. Strings with an enum or format are refined by _map_string_type.
+_BASE_TYPES = {
+    "string": "str",
+    # Integers in Proxmox often accept strings like "unlimited"
+    "integer": "int | str",
+    # Numbers in Proxmox can sometimes have string defaults
+    "number": "float | str",
+    # Booleans in Proxmox accept true/false, 1/0, yes/no
+    "boolean": "bool | int | str",
+    "null": "None",
+}
+
+# Array item specs with only these keys map directly to their base type
+_PLAIN_ITEM_KEYS = frozenset({"type", "description"})
+
+# Appended to the annotation of optional parameters
+_OPTIONAL_SUFFIX = " | None"
+
+# Schema constraint keys and the Field() keyword each one maps to
+_NUMERIC_CONSTRAINTS = (
+    ("minimum", "ge"),
+    ("maximum", "le"),
+    ("exclusiveMinimum", "gt"),
+    ("exclusiveMaximum", "lt"),
+)
+_LENGTH_CONSTRAINTS = (("minLength", "min_length"), ("maxLength", "max_length"))
+
+
+def _coerce_number(value: Any, to_int: bool) -> Any:
+    """
+    Convert a constraint value to int or float, leaving it as-is if it is not numeric.
 
-    # Proxmox custom formats and their Python equivalents
-    FORMAT_MAPPINGS = {
-        # Node-related formats
-        "pve-node": "ProxmoxNode",
-        "pve-node-list": "list[ProxmoxNode]",
-        # VM/Container ID formats
-        "pve-vmid": "ProxmoxVMID",
-        "pve-vmid-list": "list[ProxmoxVMID]",
-        # Storage formats
-        "pve-storage-id": "str",  # Storage ID/name
-        "pve-storage-id-list": "list[str]",
-        # Replication formats
-        "pve-replication-job-id": "str",
-        "pve-replication-job-id-list": "list[str]",
-        # Config ID formats
-        "pve-configid-list": "str",  # Comma-separated list
-        # Time formats
-        "pve-timezone": "str",
-        "pve-calendar-event": "str",
-        # Network formats
-        "pve-iface": "str",  # Network interface name
-        "ipv4": "str",
-        "ipv6": "str",
-        "ip": "str",  # IPv4 or IPv6
-        "cidr": "str",  # CIDR notation
-        "mac-addr": "str",
-        # Authentication formats
-        "pve-userid": "str",  # User ID with realm
-        "pve-realm": "str",
-        # Generic formats
-        "email": "str",
-        "uri": "str",
-        "uuid": "str",
-        "hostname": "str",
-    }
-
-    @classmethod
-    def map_parameter_type(
-        cls, param_spec: dict[str, Any], param_name: str = ""
-    ) -> tuple[str, dict[str, Any]]:
-        """
-        Map a Proxmox parameter specification to Python type and Pydantic Field kwargs.
-
-        Args:
-            param_spec: Parameter specification from schema
-            param_name: Parameter name for better error messages
-
-        Returns:
-            Tuple of (python_type_string, field_kwargs_dict)
-        """
-        param_type = param_spec.get("type", "string")
-        is_optional = param_spec.get("optional", False)
-        default_value = param_spec.get("default")
-
-        # Handle array types
-        if param_type == "array":
-            return cls._map_array_type(param_spec, param_name, is_optional, default_value)
-
-        # Handle object types
-        elif param_type == "object":
-            return cls._map_object_type(param_spec, param_name, is_optional, default_value)
-
-        # Handle primitive types
-        else:
-            return cls._map_primitive_type(param_spec, param_name, is_optional, default_value)
-
-    @classmethod
-    def _map_primitive_type(
-        cls, param_spec: dict[str, Any], param_name: str, is_optional: bool, default_value: Any
-    ) -> tuple[str, dict[str, Any]]:
-        """Map primitive parameter types."""
-        param_type = param_spec.get("type", "string")
-        param_format = param_spec.get("format")
-
-        # Base type mapping - make more permissive for Proxmox API compatibility
-        if param_type == "string":
-            python_type = cls._map_string_type(param_spec, default_value)
-        elif param_type == "integer":
-            # Integers in Proxmox often accept strings like "unlimited"
-            python_type = "int | str"
-        elif param_type == "number":
-            # Numbers in Proxmox can sometimes have string defaults
-            python_type = "float | str"
-        elif param_type == "boolean":
-            # Booleans in Proxmox accept true/false, 1/0, yes/no
-            python_type = "bool | int | str"
-        elif param_type == "null":
-            python_type = "None"
-        else:
-            # Unknown type, default to string
-            python_type = "str"
+    Values the schema already stores with the right type skip the conversion.
+    """
+    if type(value) is (int if to_int else float):
+        return value
+    try:
+        return int(value) if to_int else float(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def _build_literal_type(enum_values: list[Any], default_value: Any) -> str:
+    """Build the Literal[...] annotation for a small enum."""
+    # Include default value in enum if it's not already there
+    all_values = set(enum_values)
+    if default_value is not None and default_value not in all_values:
+        all_values.add(default_value)
+
+    # Create a union of literal values
+    literals = [f'"{v}"' for v in sorted(all_values)]
+    return f"Literal[{', '.join(literals)}]"
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_literal_type(
+    tagged_values: tuple[tuple[type, Any], ...], tagged_default: tuple[type, Any]
+) -> str:
+    """Cached _build_literal_type over type-tagged values, so 1 and True stay distinct keys."""
+    return _build_literal_type([v for _, v in tagged_values], tagged_default[1])
+
+
+# Substrings of a type string that require an import, found in one regex scan
+# per string. List[ is legacy and should not appear in annotations from the
+# current mapper. No trigger's suffix is another's prefix, so findall's
+# non-overlapping matches cannot hide one.
+_TYPING_TRIGGERS = {"List[": "List", "Literal[": "Literal"}
+_PYDANTIC_TRIGGERS = {"Field(": "Field"}
+_IMPORT_TRIGGERS = {
+    "ProxmoxNode": "from ..types import ProxmoxNode",
+    "ProxmoxVMID": "from ..types import ProxmoxVMID",
+    "Password": "from ..types import Password",
+    "AuthToken": "from ..types import AuthToken",
+}
+_TRIGGER_RE = re.compile(
+    "|".join(map(re.escape, [*_TYPING_TRIGGERS, *_PYDANTIC_TRIGGERS, *_IMPORT_TRIGGERS]))
+)
+
+
+# Proxmox custom formats and their Python equivalents
+_RAW_FORMAT_MAPPINGS = {
+    # Node-related formats
+    "pve-node": "ProxmoxNode",
+    "pve-node-list": "list[ProxmoxNode]",
+    # VM/Container ID formats
+    "pve-vmid": "ProxmoxVMID",
+    "pve-vmid-list": "list[ProxmoxVMID]",
+    # Storage formats
+    "pve-storage-id": "str",  # Storage ID/name
+    "pve-storage-id-list": "list[str]",
+    # Replication formats
+    "pve-replication-job-id": "str",
+    "pve-replication-job-id-list": "list[str]",
+    # Config ID formats
+    "pve-configid-list": "str",  # Comma-separated list
+    # Time formats
+    "pve-timezone": "str",
+    "pve-calendar-event": "str",
+    # Network formats
+    "pve-iface": "str",  # Network interface name
+    "ipv4": "str",
+    "ipv6": "str",
+    "ip": "str",  # IPv4 or IPv6
+    "cidr": "str",  # CIDR notation
+    "mac-addr": "str",
+    # Authentication formats
+    "pve-userid": "str",  # User ID with realm
+    "pve-realm": "str",
+    # Generic formats
+    "email": "str",
+    "uri": "str",
+    "uuid": "str",
+    "hostname": "str",
+}
+FORMAT_MAPPINGS: Final[Mapping[str, str]] = MappingProxyType(
+    {name: sys.intern(python_type) for name, python_type in _RAW_FORMAT_MAPPINGS.items()}
+)
+del _RAW_FORMAT_MAPPINGS
+
+# Formats recognized for plain string parameters: the shared mappings plus
+# the string-only secret types
+_STRING_FORMATS: Final[Mapping[str, str]] = MappingProxyType(
+    {**FORMAT_MAPPINGS, "password": "Password", "token": "AuthToken"}
+)
+
+
+# map_parameter_type results per distinct spec; identical specs (node,
+# vmid, storage, ...) recur on a large share of all endpoints
+_MAP_CACHE: OrderedDict[tuple, tuple[str, dict[str, Any]]] = OrderedDict()
+_MAP_CACHE_MAXSIZE = 4096
+
+# get_required_imports results per distinct set of type strings
+_IMPORTS_CACHE: OrderedDict[frozenset[str], list[str]] = OrderedDict()
+_IMPORTS_CACHE_MAXSIZE = 256
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    """Look up a key in an LRU cache, marking it as recently used. Returns None if absent."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any, maxsize: int) -> None:
+    """Store a value in an LRU cache, evicting the least recently used entry when full."""
+    cache[key] = value
+    if len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+def _map_parameter_type(
+    param_spec: dict[str, Any], param_name: str = ""
+) -> tuple[str, dict[str, Any]]:
+    """
+    Map a Proxmox parameter specification to Python type and Pydantic Field kwargs.
+
+    Args:
+        param_spec: Parameter specification from schema
+        param_name: Parameter name for better error messages
+
+    Returns:
+        Tuple of (python_type_string, field_kwargs_dict)
+    """
+    # The parameter name does not affect the mapping, so it is not part of the key
+    try:
+        key = tuple(sorted((k, _freeze(v)) for k, v in param_spec.items()))
+        mapped = _cache_get(_MAP_CACHE, key)
+    except TypeError:  # Spec contains an unhashable value
+        key = mapped = None
+
+    if mapped is None:
+        mapped = _map_uncached(param_spec, param_name)
+        if key is not None:
+            _cache_put(_MAP_CACHE, key, mapped, _MAP_CACHE_MAXSIZE)
+
+    python_type, field_kwargs = mapped
+    return python_type, dict(field_kwargs)
+
+
+def _map_uncached(param_spec: dict[str, Any], param_name: str) -> tuple[str, dict[str, Any]]:
+    """Map a parameter specification without consulting the cache."""
+    param_type = param_spec.get("type", "string")
+    is_optional = param_spec.get("optional", False)
+    default_value = param_spec.get("default")
+
+    # Handle array types
+    if param_type == "array":
+        mapper = _map_array_type
+
+    # Handle object types
+    elif param_type == "object":
+        mapper = _map_object_type
+
+    # Handle primitive types
+    else:
+        mapper = _map_primitive_type
+
+    python_type, field_kwargs = mapper(param_spec, param_name, is_optional, default_value)
+
+    # The same few annotations recur across thousands of fields; share one copy
+    return sys.intern(python_type), field_kwargs
+
+
+def _map_primitive_type(
+    param_spec: dict[str, Any], param_name: str, is_optional: bool, default_value: Any
+) -> tuple[str, dict[str, Any]]:
+    """Map primitive parameter types."""
+    param_type = param_spec.get("type", "string")
+    param_format = param_spec.get("format")
+
+    # Base type mapping - make more permissive for Proxmox API compatibility
+    if param_type == "string":
+        python_type = _map_string_type(param_spec, default_value)
+    else:
+        # Unknown type, default to string
+        python_type = _BASE_TYPES.get(param_type, "str")
 
-        # Apply format-specific mapping
-        if param_format and isinstance(param_format, str) and param_format in cls.FORMAT_MAPPINGS:
-            python_type = cls.FORMAT_MAPPINGS[param_format]
+    # Apply format-specific mapping (formats may also be nested dicts)
+    if isinstance(param_format, str):
+        python_type = FORMAT_MAPPINGS.get(param_format, python_type)
 
-        # Adjust type based on default value compatibility
-        python_type = cls._adjust_type_for_default(python_type, default_value)
+    # Adjust type based on default value compatibility
+    python_type = _adjust_type_for_default(python_type, default_value)
 
-        # Handle optional types
-        if is_optional:
-            python_type = f"{python_type} | None"
+    # Handle optional types
+    if is_optional:
+        python_type += _OPTIONAL_SUFFIX
 
-        # Build Pydantic Field kwargs
-        field_kwargs = cls._build_field_kwargs(param_spec, default_value, param_type)
+    # Build Pydantic Field kwargs
+    field_kwargs = _build_field_kwargs(param_spec, default_value, param_type)
 
-        return python_type, field_kwargs
+    return python_type, field_kwargs
 
-    @classmethod
-    def _adjust_type_for_default(cls, python_type: str, default_value: Any) -> str:
-        """
-        Adjust the Python type to be compatible with the default value.
 
-        For Proxmox API compatibility, we make types more permissive by default,
-        but this method handles any remaining edge cases.
-        """
-        if default_value is None:
-            return python_type
+def _adjust_type_for_default(python_type: str, default_value: Any) -> str:
+    """
+    Adjust the Python type to be compatible with the default value.
 
-        # For most cases, our permissive base types should handle the defaults
-        # This method is kept for future edge cases
+    For Proxmox API compatibility, we make types more permissive by default,
+    but this method handles any remaining edge cases.
+    """
+    if default_value is None:
         return python_type
 
-    @classmethod
-    def _map_string_type(cls, param_spec: dict[str, Any], default_value: Any = None) -> str:
-        """Map string type with format considerations."""
-        param_format = param_spec.get("format")
-
-        # Handle enum values
-        if "enum" in param_spec and param_spec["enum"] is not None:
-            enum_values = param_spec["enum"]
-            if len(enum_values) <= 10:  # Use Literal for small enums
-
-                # Include default value in enum if it's not already there
-                all_values = set(enum_values)
-                if default_value is not None and default_value not in all_values:
-                    all_values.add(default_value)
-
-                # Create a union of literal values
-                literals = [f'"{v}"' for v in sorted(all_values)]
-                return f"Literal[{', '.join(literals)}]"
-            else:
-                # For large enums, use str with validation
-                return "str"
-
-        # Handle format-specific types
-        if param_format and isinstance(param_format, str):
-            if param_format in cls.FORMAT_MAPPINGS:
-                return cls.FORMAT_MAPPINGS[param_format]
-            elif param_format == "password":
-                return "Password"
-            elif param_format == "token":
-                return "AuthToken"
-
-        return "str"
-
-    @classmethod
-    def _map_array_type(
-        cls, param_spec: dict[str, Any], param_name: str, is_optional: bool, default_value: Any
-    ) -> tuple[str, dict[str, Any]]:
-        """Map array parameter types."""
-        items_spec = param_spec.get("items", {})
-        if not items_spec:
-            # Generic array
-            python_type = "list[Any]"
+    # For most cases, our permissive base types should handle the defaults
+    # This method is kept for future edge cases
+    return python_type
+
+
+def _map_string_type(param_spec: dict[str, Any], default_value: Any = None) -> str:
+    """Map string type with format considerations."""
+    param_format = param_spec.get("format")
+
+    # Handle enum values
+    if "enum" in param_spec and param_spec["enum"] is not None:
+        enum_values = param_spec["enum"]
+        if len(enum_values) <= 10:  # Use Literal for small enums
+            tagged_values = tuple((type(v), v) for v in enum_values)
+            try:
+                return _cached_literal_type(tagged_values, (type(default_value), default_value))
+            except TypeError:  # Unhashable enum value or default
+                return _build_literal_type(enum_values, default_value)
+        else:
+            # For large enums, use str with validation
+            return "str"
+
+    # Handle format-specific types
+    if isinstance(param_format, str):
+        return _STRING_FORMATS.get(param_format, "str")
+
+    return "str"
+
+
+def _map_array_type(
+    param_spec: dict[str, Any], param_name: str, is_optional: bool, default_value: Any
+) -> tuple[str, dict[str, Any]]:
+    """Map array parameter types."""
+    items_spec = param_spec.get("items", {})
+    if not items_spec:
+        # Generic array
+        python_type = "list[Any]"
+    else:
+        # Typed array; plain primitive items (the common case) map straight
+        # to their base type without a full mapping pass
+        item_type = None
+        if items_spec.keys() <= _PLAIN_ITEM_KEYS:
+            item_type = _BASE_TYPES.get(items_spec.get("type", "string"))
+        if item_type is None:
+            item_type, _ = _map_parameter_type(items_spec, f"{param_name}_item")
+        python_type = "list[" + item_type + "]"
+
+    if is_optional:
+        python_type += _OPTIONAL_SUFFIX
+
+    # Arrays carry no numeric or length constraints
+    field_kwargs = _build_base_field_kwargs(param_spec, default_value)
+
+    return python_type, field_kwargs
+
+
+def _map_object_type(
+    param_spec: dict[str, Any], param_name: str, is_optional: bool, default_value: Any
+) -> tuple[str, dict[str, Any]]:
+    """Map object parameter types."""
+    # For now, treat objects as generic dictionaries
+    # TODO: Generate nested models for complex objects
+    python_type = "dict[str, Any]"
+
+    if is_optional:
+        python_type += _OPTIONAL_SUFFIX
+
+    # Objects carry no numeric or length constraints
+    field_kwargs = _build_base_field_kwargs(param_spec, default_value)
+
+    return python_type, field_kwargs
+
+
+def _build_base_field_kwargs(param_spec: dict[str, Any], default_value: Any) -> dict[str, Any]:
+    """Build the Field kwargs shared by every parameter type: description and default."""
+    field_kwargs = {}
+
+    # Description
+    if "description" in param_spec:
+        field_kwargs["description"] = param_spec["description"]
+
+    # Default value
+    if default_value is not None:
+        field_kwargs["default"] = default_value
+
+    return field_kwargs
+
+
+def _build_field_kwargs(
+    param_spec: dict[str, Any], default_value: Any, param_type: str = "string"
+) -> dict[str, Any]:
+    """Build Pydantic Field kwargs from parameter constraints."""
+    field_kwargs = _build_base_field_kwargs(param_spec, default_value)
+
+    # Numeric constraints (only for numeric types)
+    if param_type in ("integer", "number"):
+        to_int = param_type == "integer"
+        for spec_key, kwarg in _NUMERIC_CONSTRAINTS:
+            value = param_spec.get(spec_key)
+            if value is not None:
+                field_kwargs[kwarg] = _coerce_number(value, to_int)
+
+    # String constraints (only for string types)
+    if param_type == "string":
+        for spec_key, kwarg in _LENGTH_CONSTRAINTS:
+            value = param_spec.get(spec_key)
+            if value is not None:
+                field_kwargs[kwarg] = _coerce_number(value, True)
+
+        # Pattern validation - temporarily disabled due to regex compilation issues
+        # if "pattern" in param_spec and param_spec["pattern"] is not None:
+        #     pattern = param_spec["pattern"]
+        #     # Convert regex patterns to Python-compatible format
+        #     if pattern:
+        #         # Fix case-insensitive flag syntax: (?^i:...) -> (?i:...)
+        #         pattern = re.sub(r"\(\?\^i:", "(?i:", pattern)
+        #         # Skip extremely large patterns that would exceed regex compilation limits
+        #         if len(pattern) > 10000:  # Arbitrary limit to prevent compilation issues
+        #             # Skip this pattern constraint
+        #             pass
+        #         else:
+        #             field_kwargs["pattern"] = pattern
+
+    # Enum validation (for large enums) - disabled as Pydantic Field doesn't support enum parameter
+    # Large enums are handled by returning "str" type without validation
+    # if "enum" in param_spec and param_spec["enum"] is not None and len(param_spec["enum"]) > 10:
+    #     field_kwargs["enum"] = param_spec["enum"]
+
+    return field_kwargs
+
+
+def _get_required_imports(types_used: list[str]) -> list[str]:
+    """
+    Get required import statements for the given types.
+
+    Args:
+        types_used: List of Python type strings used in the model
+
+    Returns:
+        List of import statements
+    """
+    key = frozenset(types_used)
+    cached = _cache_get(_IMPORTS_CACHE, key)
+    if cached is None:
+        cached = _imports_for(key)
+        _cache_put(_IMPORTS_CACHE, key, cached, _IMPORTS_CACHE_MAXSIZE)
+    return list(cached)
+
+
+def _imports_for(types_used: frozenset[str]) -> list[str]:
+    """Compute the import statements for a set of type strings."""
+    imports = set()
+
+    # Standard typing imports (built-in dict/list need none)
+    typing_imports = set()
+    pydantic_imports = set()
+
+    tokens = {token for type_str in types_used for token in _TRIGGER_RE.findall(type_str)}
+    for token in tokens:
+        if token in _TYPING_TRIGGERS:
+            typing_imports.add(_TYPING_TRIGGERS[token])
+        elif token in _PYDANTIC_TRIGGERS:
+            pydantic_imports.add(_PYDANTIC_TRIGGERS[token])
         else:
-            # Typed array
-            item_type, _ = cls.map_parameter_type(items_spec, f"{param_name}_item")
-            python_type = f"list[{item_type}]"
-
-        if is_optional:
-            python_type = f"{python_type} | None"
-
-        field_kwargs = cls._build_field_kwargs(param_spec, default_value, "array")
-
-        return python_type, field_kwargs
-
-    @classmethod
-    def _map_object_type(
-        cls, param_spec: dict[str, Any], param_name: str, is_optional: bool, default_value: Any
-    ) -> tuple[str, dict[str, Any]]:
-        """Map object parameter types."""
-        # For now, treat objects as generic dictionaries
-        # TODO: Generate nested models for complex objects
-        python_type = "dict[str, Any]"
-
-        if is_optional:
-            python_type = f"{python_type} | None"
-
-        field_kwargs = cls._build_field_kwargs(param_spec, default_value, "object")
-
-        return python_type, field_kwargs
-
-    @classmethod
-    def _build_field_kwargs(
-        cls, param_spec: dict[str, Any], default_value: Any, param_type: str = "string"
-    ) -> dict[str, Any]:
-        """Build Pydantic Field kwargs from parameter constraints."""
-        field_kwargs = {}
-
-        # Description
-        if "description" in param_spec:
-            field_kwargs["description"] = param_spec["description"]
-
-        # Default value
-        if default_value is not None:
-            field_kwargs["default"] = default_value
-
-        # Numeric constraints (only for numeric types)
-        if param_type in ("integer", "number"):
-            if "minimum" in param_spec and param_spec["minimum"] is not None:
-                try:
-                    field_kwargs["ge"] = (
-                        int(param_spec["minimum"])
-                        if param_type == "integer"
-                        else float(param_spec["minimum"])
-                    )
-                except (ValueError, TypeError):
-                    field_kwargs["ge"] = param_spec["minimum"]
-            if "maximum" in param_spec and param_spec["maximum"] is not None:
-                try:
-                    field_kwargs["le"] = (
-                        int(param_spec["maximum"])
-                        if param_type == "integer"
-                        else float(param_spec["maximum"])
-                    )
-                except (ValueError, TypeError):
-                    field_kwargs["le"] = param_spec["maximum"]
-            if "exclusiveMinimum" in param_spec and param_spec["exclusiveMinimum"] is not None:
-                try:
-                    field_kwargs["gt"] = (
-                        int(param_spec["exclusiveMinimum"])
-                        if param_type == "integer"
-                        else float(param_spec["exclusiveMinimum"])
-                    )
-                except (ValueError, TypeError):
-                    field_kwargs["gt"] = param_spec["exclusiveMinimum"]
-            if "exclusiveMaximum" in param_spec and param_spec["exclusiveMaximum"] is not None:
-                try:
-                    field_kwargs["lt"] = (
-                        int(param_spec["exclusiveMaximum"])
-                        if param_type == "integer"
-                        else float(param_spec["exclusiveMaximum"])
-                    )
-                except (ValueError, TypeError):
-                    field_kwargs["lt"] = param_spec["exclusiveMaximum"]
-
-        # String constraints (only for string types)
-        if param_type == "string":
-            if "minLength" in param_spec and param_spec["minLength"] is not None:
-                try:
-                    field_kwargs["min_length"] = int(param_spec["minLength"])
-                except (ValueError, TypeError):
-                    field_kwargs["min_length"] = param_spec["minLength"]
-            if "maxLength" in param_spec and param_spec["maxLength"] is not None:
-                try:
-                    field_kwargs["max_length"] = int(param_spec["maxLength"])
-                except (ValueError, TypeError):
-                    field_kwargs["max_length"] = param_spec["maxLength"]
-
-            # Pattern validation - temporarily disabled due to regex compilation issues
-            # if "pattern" in param_spec and param_spec["pattern"] is not None:
-            #     pattern = param_spec["pattern"]
-            #     # Convert regex patterns to Python-compatible format
-            #     if pattern:
-            #         # Fix case-insensitive flag syntax: (?^i:...) -> (?i:...)
-            #         pattern = re.sub(r"\(\?\^i:", "(?i:", pattern)
-            #         # Skip extremely large patterns that would exceed regex compilation limits
-            #         if len(pattern) > 10000:  # Arbitrary limit to prevent compilation issues
-            #             # Skip this pattern constraint
-            #             pass
-            #         else:
-            #             field_kwargs["pattern"] = pattern
-
-        # Enum validation (for large enums) - disabled as Pydantic Field doesn't support enum parameter
-        # Large enums are handled by returning "str" type without validation
-        # if "enum" in param_spec and param_spec["enum"] is not None and len(param_spec["enum"]) > 10:
-        #     field_kwargs["enum"] = param_spec["enum"]
-
-        return field_kwargs
-
-    @classmethod
-    def get_required_imports(cls, types_used: list[str]) -> list[str]:
-        """
-        Get required import statements for the given types.
-
-        Args:
-            types_used: List of Python type strings used in the model
-
-        Returns:
-            List of import statements
-        """
-        imports = set()
-
-        # Standard typing imports
-        typing_imports = set()
-        pydantic_imports = set()
-
-        for type_str in types_used:
-            # Check for List (legacy - should not happen with new code)
-            if "List[" in type_str:
-                typing_imports.add("List")
-
-            # Check for Dict (not needed for built-in dict)
-            # if "dict[" in type_str:
-            #     typing_imports.add("Dict")
-
-            # Check for Literal
-            if "Literal[" in type_str:
-                typing_imports.add("Literal")
-
-            # Check for Pydantic types
-            if "Field(" in type_str:
-                pydantic_imports.add("Field")
-
-            # Check for custom types
-            if "ProxmoxNode" in type_str:
-                imports.add("from ..types import ProxmoxNode")
-            if "ProxmoxVMID" in type_str:
-                imports.add("from ..types import ProxmoxVMID")
-            if "Password" in type_str:
-                imports.add("from ..types import Password")
-            if "AuthToken" in type_str:
-                imports.add("from ..types import AuthToken")
-
-        # Add typing imports
-        if typing_imports:
-            imports.add(f"from typing import {', '.join(sorted(typing_imports))}")
-
-        # Add Pydantic imports
-        if pydantic_imports:
-            imports.add(f"from pydantic import {', '.join(sorted(pydantic_imports))}")
-
-        return sorted(imports)
+            # Custom types
+            imports.add(_IMPORT_TRIGGERS[token])
+
+    # Add typing imports
+    if typing_imports:
+        imports.add(f"from typing import {', '.join(sorted(typing_imports))}")
+
+    # Add Pydantic imports
+    if pydantic_imports:
+        imports.add(f"from pydantic import {', '.join(sorted(pydantic_imports))}")
+
+    return sorted(imports)
+
+
+class TypeMapper:
+    """
+    Maps Proxmox API parameter specifications to Python/Pydantic types.
+
+    Handles type conversion, constraints, and Pydantic Field generation.
+    The mapping itself is implemented by the module-level functions above;
+    the class is kept as the stable entry point.
+    """
+
+    # Proxmox custom formats and their Python equivalents (read-only)
+    FORMAT_MAPPINGS = FORMAT_MAPPINGS
+
+    map_parameter_type = staticmethod(_map_parameter_type)
+    get_required_imports = staticmethod(_get_required_imports)
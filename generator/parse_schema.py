@@ -6,8 +6,12 @@ Python objects with proper type annotations.
 
 import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Literal
 
+# A {param} path segment, capturing the parameter name
+_PATH_PARAM_RE = re.compile(r"\{(\w+)\}")
+
 
 @dataclass
 class Parameter:
@@ -66,6 +70,11 @@ class Endpoint:
     python_path: str = ""  # e.g., "nodes.qemu.item"
     class_name: str = ""  # e.g., "NodesQemuItemEndpoints"
 
+    @cached_property
+    def is_param(self) -> bool:
+        """True if this segment is a path parameter like {node}."""
+        return self.text[:1] == "{"
+
 
 class SchemaParser:
     """Parse raw schema into structured format."""
@@ -73,23 +82,38 @@ class SchemaParser:
     def parse(self, raw_schema: list[dict[str, Any]]) -> list[Endpoint]:
         """Parse schema recursively into Endpoint objects.
 
+        The tree is walked with an explicit stack rather than recursion, so
+        deeply nested paths cannot hit the interpreter recursion limit.
+
         Args:
             raw_schema: Raw schema list from JSON parsing.
 
         Returns:
             List of parsed Endpoint objects.
         """
-        return [self._parse_node(node, parent_path="") for node in raw_schema]
+        roots: list[Endpoint] = []
+
+        # Each work item is a raw node and the list its Endpoint belongs in.
+        # Children are pushed in reverse so they are appended in schema order.
+        stack = [(node, roots) for node in reversed(raw_schema)]
+        while stack:
+            node, siblings = stack.pop()
+            endpoint = self._parse_node(node)
+            siblings.append(endpoint)
 
-    def _parse_node(self, node: dict[str, Any], parent_path: str) -> Endpoint:
-        """Parse single schema node into Endpoint object.
+            if "children" in node:
+                stack.extend((child, endpoint.children) for child in reversed(node["children"]))
+
+        return roots
+
+    def _parse_node(self, node: dict[str, Any]) -> Endpoint:
+        """Parse single schema node into Endpoint object, without its children.
 
         Args:
             node: Raw schema node dictionary.
-            parent_path: Parent path for building full paths.
 
         Returns:
-            Parsed Endpoint object.
+            Parsed Endpoint object with an empty children list.
         """
         path = node["path"]
         text = node["text"]
@@ -97,20 +121,15 @@ class SchemaParser:
         endpoint = Endpoint(path=path, text=text, leaf=node.get("leaf", 0) == 1)
 
         # Extract path parameters: /nodes/{node}/qemu/{vmid}
-        endpoint.path_params = re.findall(r"\{(\w+)\}", path)
+        endpoint.path_params = _PATH_PARAM_RE.findall(path)
 
         # Parse methods (GET, POST, PUT, DELETE)
         if "info" in node:
             for method_name, method_info in node["info"].items():
                 endpoint.methods[method_name] = self._parse_method(method_name, method_info)
 
-        # Parse children recursively
-        if "children" in node:
-            endpoint.children = [self._parse_node(child, path) for child in node["children"]]
-
         # Generate Python naming
-        endpoint.python_path = self._generate_python_path(path)
-        endpoint.class_name = self._generate_class_name(path)
+        endpoint.python_path, endpoint.class_name = self._derive_names(path)
 
         return endpoint
 
@@ -191,49 +210,30 @@ class SchemaParser:
             items=response_info.get("items"),
         )
 
-    def _generate_python_path(self, api_path: str) -> str:
-        """Convert API path to Python attribute path.
+    def _derive_names(self, api_path: str) -> tuple[str, str]:
+        """Convert an API path to its Python attribute path and class name.
 
-        Examples:
-        /nodes/{node}/qemu/{vmid}/config → nodes.item.qemu.item.config
-
-        Args:
-            api_path: API path string.
-
-        Returns:
-            Python attribute path.
-        """
-        parts = api_path.strip("/").split("/")
-        python_parts = []
-
-        for part in parts:
-            if "{" in part:
-                param = part.strip("{}")
-                python_parts.append("item")
-            else:
-                python_parts.append(part)
-
-        return ".".join(python_parts)
-
-    def _generate_class_name(self, api_path: str) -> str:
-        """Generate class name from API path.
+        Both are built in one pass over the path segments.
 
         Examples:
-        /nodes/{node}/qemu/{vmid} → NodesQemuItemEndpoints
+        /nodes/{node}/qemu/{vmid}/config → nodes.item.qemu.item.config,
+        NodesItemQemuItemConfigEndpoints
 
         Args:
             api_path: API path string.
 
         Returns:
-            Generated class name.
+            Tuple of (Python attribute path, generated class name).
         """
-        parts = api_path.strip("/").split("/")
+        python_parts = []
         name_parts = []
 
-        for part in parts:
+        for part in api_path.strip("/").split("/"):
             if "{" in part:
+                python_parts.append("item")
                 name_parts.append("Item")
             else:
+                python_parts.append(part)
                 name_parts.append(part.capitalize())
 
-        return "".join(name_parts) + "Endpoints"
+        return ".".join(python_parts), "".join(name_parts) + "Endpoints"
@@ -87,6 +87,41 @@ def sample_schema():
     ]
 
 
+@pytest.fixture
+def deep_tree_depth():
+    """Endpoint tree depth beyond the interpreter recursion limit."""
+    return sys.getrecursionlimit() + 100
+
+
+@pytest.fixture
+def make_endpoint_chain():
+    """Factory for a single chain of nested endpoints below /deep.
+
+    make_endpoint_chain(depth, method) returns the root of a chain `depth`
+    levels deep. Every endpoint below the root gets its own copy of
+    `method` as its GET method, if one is given.
+    """
+    import copy
+
+    from generator.parse_schema import Endpoint
+
+    def make(depth, method=None):
+        root = Endpoint(path="/deep", text="deep", leaf=False)
+        current = root
+        for i in range(depth):
+            child = Endpoint(
+                path=f"{current.path}/s{i}",
+                text=f"s{i}",
+                leaf=False,
+                methods={"GET": copy.deepcopy(method)} if method else {},
+            )
+            current.children.append(child)
+            current = child
+        return root
+
+    return make
+
+
 @pytest.fixture(scope="session")
 def generated_sdk_available():
     """Check if generated SDK is available for testing."""
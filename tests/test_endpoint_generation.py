@@ -236,6 +236,27 @@ class TestEndpointFileGeneration:
         assert len(file.classes) > 0
         assert "Endpoints" in file.classes[0].name
 
+    def test_write_endpoints_recomputes_imports(self, tmp_path):
+        """Test imports are collected from the classes a file holds when it is written."""
+        generator = EndpointGenerator()
+        endpoint = Endpoint(
+            path="/access/users",
+            text="users",
+            leaf=True,
+            methods={"GET": Method(method="GET", name="index", returns=Response(type="object"))},
+        )
+        files = generator.generate_endpoints(
+            [Endpoint(path="/access", text="access", leaf=False, children=[endpoint])],
+            {"Access_UsersGETResponse": "Access_UsersGETResponse"},
+        )
+        users_file = next(f for f in files if f.file_path == "access/users.py")
+        users_file.imports = "stale"
+
+        generator.write_endpoints(files, tmp_path)
+
+        assert "Access_UsersGETResponse" in users_file.imports
+        assert "stale" not in (tmp_path / "access" / "users.py").read_text()
+
     def test_generate_hierarchical_endpoints(self):
         """Test generation of hierarchical endpoint structure."""
         generator = EndpointGenerator()
@@ -271,6 +292,16 @@ class TestEndpointFileGeneration:
         file_paths = [f.file_path for f in files]
         assert "access.py" in file_paths or "access/users.py" in file_paths
 
+    def test_generate_deep_endpoint_tree(self, make_endpoint_chain, deep_tree_depth):
+        """Test generation of a tree deeper than the interpreter recursion limit."""
+        generator = EndpointGenerator()
+
+        files = generator.generate_endpoints([make_endpoint_chain(deep_tree_depth)], {})
+
+        file_paths = {f.file_path for f in files}
+        assert "deep/s0.py" in file_paths
+        assert len(files) == deep_tree_depth
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -214,6 +214,212 @@ class TestModelGenerator:
             type_annotation, field_kwargs = mapper.map_parameter_type(param_spec)
             assert type_annotation == expected_type
 
+    def test_type_mapper_cache_returns_fresh_kwargs(self):
+        """Test repeated specs hit the mapper cache without sharing kwargs dicts."""
+        from generator.generators.type_mapper import TypeMapper
+
+        spec = {"type": "integer", "minimum": 1, "default": 1}
+        type_a, kwargs_a = TypeMapper.map_parameter_type(spec, "a")
+        kwargs_a["ge"] = 99
+        type_b, kwargs_b = TypeMapper.map_parameter_type(dict(reversed(spec.items())), "b")
+        _, kwargs_c = TypeMapper.map_parameter_type({**spec, "default": True})
+
+        assert type_a == type_b
+        assert kwargs_b == {"default": 1, "ge": 1}
+        assert kwargs_c["default"] is True
+
+    def test_type_mapper_cache_is_bounded(self, monkeypatch):
+        """Test the mapper cache evicts its least recently used spec when full."""
+        from collections import OrderedDict
+
+        from generator.generators import type_mapper
+
+        monkeypatch.setattr(type_mapper, "_MAP_CACHE", OrderedDict())
+        monkeypatch.setattr(type_mapper, "_MAP_CACHE_MAXSIZE", 2)
+
+        for spec in ({"type": "string"}, {"type": "integer"}, {"type": "string"}):
+            type_mapper.TypeMapper.map_parameter_type(spec)
+        type_mapper.TypeMapper.map_parameter_type({"type": "boolean"})
+
+        cached_types = [dict(key)["type"] for key in type_mapper._MAP_CACHE]
+        assert cached_types == [(str, "string"), (str, "boolean")]
+
+    def test_parameter_type_cache(self):
+        """Test cached parameter mappings are distinct per spec and safe to modify."""
+        generator = ModelGenerator()
+
+        type_a, kwargs_a = generator._map_parameter_type(
+            Parameter(name="a", type="integer", default=1)
+        )
+        kwargs_a["description"] = "changed"
+        type_b, kwargs_b = generator._map_parameter_type(
+            Parameter(name="b", type="integer", default=1)
+        )
+        _, kwargs_c = generator._map_parameter_type(
+            Parameter(name="c", type="integer", default=True)
+        )
+
+        assert type_a == type_b
+        assert kwargs_b == {"default": 1}
+        assert kwargs_c["default"] is True
+
+    def test_identical_parameters_get_separate_fields(self):
+        """Test request models with identical parameter lists do not share field objects."""
+        generator = ModelGenerator()
+        parameters = [Parameter(name="node-id", type="string", description="Node")]
+        first = Endpoint(path="/a", text="a", leaf=True, methods={}, children=[])
+        second = Endpoint(path="/b", text="b", leaf=True, methods={}, children=[])
+
+        model_a = generator._generate_request_model(
+            first, "PUT", Method(method="PUT", name="set", parameters=parameters)
+        )
+        model_b = generator._generate_request_model(
+            second, "PUT", Method(method="PUT", name="set", parameters=list(parameters))
+        )
+
+        assert model_a.name == "APUTRequest"
+        assert model_b.name == "BPUTRequest"
+        assert model_a.fields == model_b.fields
+        assert model_a.fields[0] is not model_b.fields[0]
+        model_a.fields[0].field_kwargs["description"] = "changed"
+        assert model_b.fields[0].field_kwargs == {
+            "description": "Node",
+            "serialization_alias": "node-id",
+        }
+
+    def test_identical_responses_get_separate_data_fields(self):
+        """Test response models with the same return shape do not share their data field."""
+        generator = ModelGenerator()
+        returns = Response(type="array", items={"type": "string"})
+        first = Endpoint(path="/a", text="a", leaf=True, methods={}, children=[])
+        second = Endpoint(path="/b", text="b", leaf=True, methods={}, children=[])
+
+        model_a = generator._generate_response_model(
+            first, "GET", Method(method="GET", name="list", returns=returns)
+        )
+        model_b = generator._generate_response_model(
+            second, "GET", Method(method="GET", name="list", returns=returns)
+        )
+        model_c = generator._generate_response_model(
+            second, "POST", Method(method="POST", name="create", returns=returns)
+        )
+
+        assert model_a.name == "AGETResponse"
+        assert model_b.name == "BGETResponse"
+        assert model_b.docstring == "Response model for /b GET"
+        assert model_a.fields == model_b.fields
+        assert model_a.fields[0] is not model_b.fields[0]
+        assert model_c.fields[0].type_annotation == "list[str]"
+        assert model_c.fields[0].field_kwargs == {"description": "Response data for POST"}
+
+    def test_models_reused_across_generation_paths(self):
+        """Test a second pass over the same endpoints reuses models and their names."""
+        generator = ModelGenerator()
+        endpoint = Endpoint(
+            path="/access",
+            text="access",
+            leaf=True,
+            methods={
+                "PUT": Method(
+                    method="PUT",
+                    name="set",
+                    parameters=[Parameter(name="id", type="string")],
+                    returns=Response(type="object"),
+                )
+            },
+            children=[],
+        )
+
+        model_files = generator.generate_models([endpoint])
+        counter = dict(generator.model_counter)
+        _, name_map = generator.generate_models_file_with_names([endpoint], "access")
+
+        assert [m.name for m in model_files[0].models] == ["AccessPUTRequest", "AccessPUTResponse"]
+        assert name_map == {
+            "AccessPUTRequest": "AccessPUTRequest",
+            "AccessPUTResponse": "AccessPUTResponse",
+        }
+        assert dict(generator.model_counter) == counter
+
+    def test_model_cache_distinguishes_methods(self):
+        """Test a different Method for the same endpoint and method name gets a new model."""
+        generator = ModelGenerator()
+        endpoint = Endpoint(path="/access", text="access", leaf=True)
+        first = Method(method="GET", name="get", parameters=[Parameter(name="a", type="string")])
+        second = Method(method="GET", name="get", parameters=[Parameter(name="b", type="string")])
+
+        model_a = generator._generate_request_model(endpoint, "GET", first)
+        model_b = generator._generate_request_model(endpoint, "GET", second)
+
+        assert generator._generate_request_model(endpoint, "GET", second) is model_b
+        assert model_a.name == "AccessGETRequest"
+        assert model_b.name == "AccessGETRequest1"
+        assert [f.name for f in model_b.fields] == ["b"]
+
+    def test_fast_renderer_matches_template(self):
+        """Test the direct model renderer emits exactly what the Jinja template does."""
+        from generator.generators.model_generator import (
+            _MODEL_TEMPLATE,
+            ModelField,
+            PydanticModel,
+            _render_model_file,
+        )
+
+        fields = [
+            ModelField(
+                name="name",
+                type_annotation="str | None",
+                field_kwargs={"description": "Name <'&\">", "default": None, "ge": 1.5},
+            ),
+            ModelField(
+                name="flags",
+                type_annotation="list[str]",
+                field_kwargs={"default": ["a", "b"], "strict": True, "extra": {"b": 1, "a": 2}},
+            ),
+        ]
+        models = [
+            PydanticModel(name="FirstModel", fields=fields, docstring="First"),
+            PydanticModel(name="EmptyModel", fields=[]),
+        ]
+        imports = ["from pydantic import BaseModel, ConfigDict, Field"]
+
+        expected = _MODEL_TEMPLATE.render(module_name="nodes", imports=imports, models=models)
+        assert _render_model_file("nodes", imports, models) == expected
+        assert _render_model_file("nodes", imports, models, use_jinja=True) == expected
+        # Second render reuses each field's formatted source
+        assert fields[0].source is not None
+        assert _render_model_file("nodes", imports, models) == expected
+
+    def test_written_files_respect_umask(self, tmp_path):
+        """Test generated files get the same permissions as Path.write_text would give."""
+        import os
+
+        from generator.generators._common import write_file
+
+        old_umask = os.umask(0o002)
+        try:
+            write_file(tmp_path / "models.py", "x = 1\n")
+            (tmp_path / "reference.py").write_text("x = 1\n")
+        finally:
+            os.umask(old_umask)
+
+        mode = (tmp_path / "models.py").stat().st_mode & 0o777
+        assert mode == (tmp_path / "reference.py").stat().st_mode & 0o777 == 0o664
+
+    def test_generate_models_deep_tree(self, make_endpoint_chain, deep_tree_depth):
+        """Test model generation for a tree deeper than the recursion limit."""
+        generator = ModelGenerator()
+        root = make_endpoint_chain(
+            deep_tree_depth, Method(method="GET", name="get", returns=Response(type="object"))
+        )
+
+        model_files = generator.generate_models([root])
+
+        assert len(model_files) == 1
+        assert model_files[0].filename == "deep.py"
+        assert len(model_files[0].models) == deep_tree_depth
+        assert model_files[0].models[0].name == "Deep_S0GETResponse"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,137 @@
+"""
+Tests for schema analysis functionality.
+
+Tests the SchemaAnalyzer class to ensure statistics and patterns are collected
+correctly across the whole endpoint tree.
+"""
+
+import functools
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from generator.analyze_schema import SchemaAnalyzer
+from generator.parse_schema import Endpoint, Method, Parameter, Response
+
+
+@pytest.fixture
+def make_chain(make_endpoint_chain):
+    """Chain builder whose endpoints each have a GET with one optional parameter."""
+    method = Method(
+        method="GET",
+        name="get",
+        parameters=[Parameter(name="id", type="integer", optional=True)],
+        returns=Response(type="object"),
+    )
+    return functools.partial(make_endpoint_chain, method=method)
+
+
+class TestSchemaAnalyzerTraversal:
+    """Test traversal of the endpoint tree."""
+
+    def test_deep_tree_beyond_recursion_limit(self, make_chain, deep_tree_depth):
+        """Test analysis of a tree deeper than the interpreter recursion limit."""
+        analyzer = SchemaAnalyzer()
+
+        analysis = analyzer.analyze([make_chain(deep_tree_depth)])
+
+        assert analysis.stats.total_endpoints == deep_tree_depth + 1
+        assert analysis.stats.total_methods == deep_tree_depth
+        assert analysis.stats.leaf_endpoints == 1
+        assert analysis.parameter_patterns["optional_ratios"]["optional"] == deep_tree_depth
+
+    def test_endpoint_tree_preserves_order(self):
+        """Test the endpoint tree keeps children in schema order."""
+        children = [
+            Endpoint(path=f"/root/{name}", text=name, leaf=True) for name in ("a", "b", "c")
+        ]
+        root = Endpoint(path="/root", text="root", leaf=False, children=children)
+        analyzer = SchemaAnalyzer()
+
+        tree = analyzer._build_endpoint_tree([root])
+
+        assert tree["total_endpoints"] == 1
+        root_node = tree["root_endpoints"][0]
+        assert [c["text"] for c in root_node["children"]] == ["a", "b", "c"]
+        assert "children" not in root_node["children"][0]
+
+    def test_endpoint_tree_is_opt_in(self, make_chain):
+        """Test the endpoint tree is only built when requested."""
+        analyzer = SchemaAnalyzer()
+        endpoints = [make_chain(3)]
+
+        assert analyzer.analyze(endpoints).endpoint_tree == {}
+        tree = analyzer.analyze(endpoints, include_tree=True).endpoint_tree
+        assert tree["root_endpoints"][0]["path"] == "/deep"
+
+
+class TestSchemaAnalyzerPatterns:
+    """Test parameter pattern analysis."""
+
+    def test_optional_ratio(self):
+        """Test optional and required parameters are counted in one pass."""
+        child = Endpoint(
+            path="/root/child",
+            text="child",
+            leaf=True,
+            methods={
+                "POST": Method(
+                    method="POST",
+                    name="create",
+                    parameters=[
+                        Parameter(name="a", type="string", optional=True),
+                        Parameter(name="b", type="string"),
+                        Parameter(name="c", type="integer", minimum=0),
+                    ],
+                )
+            },
+        )
+        root = Endpoint(
+            path="/root",
+            text="root",
+            leaf=False,
+            methods={
+                "GET": Method(
+                    method="GET",
+                    name="get",
+                    parameters=[Parameter(name="a", type="string", optional=True)],
+                )
+            },
+            children=[child],
+        )
+        analyzer = SchemaAnalyzer()
+
+        patterns = analyzer._analyze_parameter_patterns([root])
+
+        assert patterns["optional_ratios"] == {"optional": 2, "required": 2, "ratio": 0.5}
+        assert patterns["common_names"]["a"] == 2
+        assert patterns["constraint_usage"]["range"] == 1
+
+
+class TestSchemaAnalyzerReanalysis:
+    """Test repeated analysis of a changing tree."""
+
+    def test_changed_tree_is_reanalyzed(self, make_chain):
+        """Test each analysis reflects the tree as it is, including in-place edits."""
+        analyzer = SchemaAnalyzer()
+        endpoints = [make_chain(2)]
+        first = analyzer.analyze(endpoints)
+
+        endpoints.append(Endpoint(path="/other", text="other", leaf=True))
+        second = analyzer.analyze(endpoints)
+        endpoints[0].children[0].methods["GET"].parameters[0].type = "string"
+        third = analyzer.analyze(endpoints)
+
+        assert first is not second
+        assert first.stats.total_endpoints == 3
+        assert second.stats.total_endpoints == 4
+        assert second.stats.parameter_type_counts == {"integer": 2}
+        assert third.stats.parameter_type_counts == {"integer": 1, "string": 1}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
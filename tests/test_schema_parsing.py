@@ -0,0 +1,53 @@
+"""
+Tests for schema parsing functionality.
+
+Tests the SchemaParser class to ensure the raw schema tree is turned into
+Endpoint objects with the right structure and path metadata.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from generator.parse_schema import SchemaParser
+
+
+class TestSchemaParserTraversal:
+    """Test parsing of the raw schema tree."""
+
+    def test_parse_deep_tree_preserves_order(self, deep_tree_depth):
+        """Test parsing a tree deeper than the recursion limit keeps schema order."""
+        raw = {"path": "/deep", "text": "deep"}
+        current = raw
+        for i in range(deep_tree_depth):
+            child = {"path": f"{current['path']}/s{i}", "text": f"s{i}"}
+            current["children"] = [child, {"path": f"{current['path']}/z", "text": "z", "leaf": 1}]
+            current = child
+
+        endpoints = SchemaParser().parse([raw, {"path": "/other", "text": "other"}])
+
+        assert [e.path for e in endpoints] == ["/deep", "/other"]
+        node = endpoints[0]
+        for i in range(deep_tree_depth):
+            assert [c.text for c in node.children] == [f"s{i}", "z"]
+            assert node.children[1].leaf
+            node = node.children[0]
+        assert node.children == []
+        assert node.class_name.startswith("DeepS0S1")
+
+    def test_path_params_from_path(self):
+        """Test {param} segments of the path are collected in order."""
+        raw = {"path": "/nodes/{node}/qemu/{vmid}/config", "text": "config"}
+
+        endpoint = SchemaParser().parse([raw])[0]
+
+        assert endpoint.path_params == ["node", "vmid"]
+        assert SchemaParser().parse([{"path": "/nodes", "text": "nodes"}])[0].path_params == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -33,16 +33,27 @@ from generator.parse_schema import SchemaParser
 app = typer.Typer()
 console = Console()
 
+# Jinja2 environment and endpoint template, compiled once per process.
+# Compiled template bytecode is also cached on disk across generator runs.
+_TEMPLATE_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).parent.parent / "generator" / "templates"),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
+)
+_ENDPOINT_TEMPLATE = _TEMPLATE_ENV.get_template("endpoint.py.jinja")
+
 
 class SDKGenerator:
     """Complete SDK generation pipeline"""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, legacy_templates: bool = False):
         self.output_dir = output_dir
         self.fetcher = SchemaFetcher()
         self.parser = SchemaParser()
         self.analyzer = SchemaAnalyzer()
-        self.model_gen = ModelGenerator()
+        self.model_gen = ModelGenerator(use_jinja=legacy_templates)
         self.endpoint_gen = EndpointGenerator()
         self.client_gen = ClientGenerator()
 
@@ -53,7 +64,10 @@ class SDKGenerator:
 
         # Step 1: Fetch schema
         console.print("\n[yellow]Step 1:[/yellow] Fetching API schema from GitHub...")
-        raw_schema = await self.fetcher.fetch_and_parse()
+        try:
+            raw_schema = await self.fetcher.fetch_and_parse()
+        finally:
+            await self.fetcher.aclose()
         console.print(f"[green]✓[/green] Fetched {len(raw_schema)} top-level endpoints")
 
         # Step 2: Parse schema
@@ -154,21 +168,12 @@ class SDKGenerator:
 
     def _generate_endpoint_file_code(self, endpoint_file) -> str:
         """Generate code for a single endpoint file"""
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent.parent / "generator" / "templates"
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        template = env.get_template("endpoint.py.jinja")
-
         # Update imports
         imports = self._collect_imports(endpoint_file.classes)
         endpoint_file.imports = imports
 
         # Render template
-        content = template.render(
+        content = _ENDPOINT_TEMPLATE.render(
             classes=endpoint_file.classes,
             imports=endpoint_file.imports,
         )
@@ -284,6 +289,9 @@ def generate(
     force: bool = typer.Option(
         False, "--force", "-f", help="Force regeneration even if output exists"
     ),
+    legacy_templates: bool = typer.Option(
+        False, "--legacy-templates", help="Render model files through the Jinja template"
+    ),
 ):
     """Generate Proxmox VE SDK from API schema"""
 
@@ -292,7 +300,7 @@ def generate(
         console.print("Use --force to regenerate")
         raise typer.Exit(1)
 
-    generator = SDKGenerator(output_dir)
+    generator = SDKGenerator(output_dir, legacy_templates)
     asyncio.run(generator.generate())
 
 